@@ -14,6 +14,12 @@ class BlogConfig(AppConfig):
     def ready(self):
         try:
             from apps.core.management.config.navigation import nav_config
+            from apps.core.management.config.publish import (
+                SITE_DEPENDS_ON,
+                publish_config,
+            )
+
+            from .models.articles import Article
 
             # nav items
             nav_config.register(
@@ -23,6 +29,17 @@ class BlogConfig(AppConfig):
                 icon="bi bi-journal-text",
             )
 
+            # Pre-rendered pages: the sidebar lists categories and recent
+            # articles, so any article change re-renders every blog page
+            blog_depends_on = f"{SITE_DEPENDS_ON} blog.Article blog.Category blog.Tag"
+            publish_config.register("blogpage", depends_on=blog_depends_on)
+            publish_config.register(
+                "blog-details",
+                queryset=lambda: Article.objects.all(),
+                url_kwargs=lambda article: {"pk": article.pk},
+                depends_on=f"{blog_depends_on} blog.Comment",
+            )
+
             logger.info(f"{self.name} configured successfully")
 
         except Exception as e:
@@ -2,11 +2,15 @@ from django.contrib import messages
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.shortcuts import get_object_or_404, render
 
+from apps.core.decorators.db import query_budget, read_from_replica
+
 from ..forms.comments import ReplyForm
 from ..forms.search import SearchForm
 from ..models.articles import Article, Category, Tag
 
 
+@query_budget(queries=15)
+@read_from_replica
 def blog(request):
     articles = Article.objects.order_by("-date_created")
     categories = Category.objects
@@ -59,6 +63,8 @@ def blog(request):
     return render(request, "blog/blogpage.html", context)
 
 
+@query_budget(queries=20)
+@read_from_replica
 def details(request, pk):
     article = get_object_or_404(Article, id=pk)
     articles = Article.objects.order_by("-date_created")
@@ -6,3 +6,44 @@ APP_NAME = "apps.core"
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = APP_NAME
+
+    def ready(self):
+        # Connect cache invalidation receivers
+        from . import signals  # noqa: F401
+
+        # Register system checks
+        from . import checks  # noqa: F401
+        from .management.config.bundles import bundle_config
+
+        vendor = "core/vendor/node_modules"
+
+        # Loaded on every page (see core/index.html)
+        bundle_config.register(
+            "core",
+            css=[
+                f"{vendor}/bootstrap-icons/font/bootstrap-icons.min.css",
+                f"{vendor}/aos/dist/aos.css",
+                "core/init/aos/init.css",
+                "core/overlay/preloader/overlay.css",
+            ],
+            js=[
+                f"{vendor}/bootstrap/dist/js/bootstrap.bundle.min.js",
+                "core/init/bootstrap/init.js",
+                f"{vendor}/aos/dist/aos.js",
+                "core/init/aos/init.js",
+                "core/overlay/preloader/overlay.js",
+            ],
+        )
+
+        # Loaded on pages showing the portfolio
+        bundle_config.register(
+            "portfolio",
+            css=[f"{vendor}/glightbox/dist/css/glightbox.min.css"],
+            js=[
+                f"{vendor}/htmx.org/dist/htmx.min.js",
+                f"{vendor}/waypoints/lib/noframework.waypoints.min.js",
+                f"{vendor}/imagesloaded/imagesloaded.pkgd.min.js",
+                f"{vendor}/isotope-layout/dist/isotope.pkgd.min.js",
+                f"{vendor}/glightbox/dist/js/glightbox.min.js",
+            ],
+        )
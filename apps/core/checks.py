@@ -0,0 +1,172 @@
+import os
+from importlib.util import find_spec
+
+from decouple import config
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error, Warning, register
+
+
+def get_cpu_count():
+    """CPUs this process may run on (the container's share, not the host's)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def get_server_concurrency():
+    """
+    Gunicorn workers and threads per worker, from the same environment
+    variables gunicorn.conf.py reads. Workers default to 2 x CPUs + 1, or to
+    one per CPU when each worker runs several threads.
+    """
+    threads = config("GUNICORN_THREADS", cast=int, default=1)
+    cpus = get_cpu_count()
+    default_workers = cpus * 2 + 1 if threads == 1 else cpus
+    workers = config("WEB_CONCURRENCY", cast=int, default=default_workers)
+    return workers, threads
+
+
+def get_local_cache_aliases():
+    """
+    Cache aliases in use that keep one cache per process, so a write in one
+    worker isn't seen by the others. The sessions alias only counts when
+    the session engine reads from the cache.
+    """
+    aliases = []
+    for alias in settings.CACHES:
+        if alias == settings.SESSION_CACHE_ALIAS and "cache" not in settings.SESSION_ENGINE:
+            continue
+        if isinstance(caches[alias], LocMemCache):
+            aliases.append(alias)
+    return aliases
+
+
+@register()
+def check_shared_caches(app_configs, **kwargs):
+    """
+    Check that the caches are shared between gunicorn workers: cache
+    versions and model generations bumped by one worker must be seen by
+    all of them. The development server is a single process.
+    """
+    if settings.DEBUG:
+        return []
+    workers, _ = get_server_concurrency()
+    if workers == 1:
+        return []
+    return [
+        Error(
+            f"Cache '{alias}' is local to each of the {workers} gunicorn "
+            "workers: invalidations in one worker won't reach the others.",
+            hint=f"Set CACHE_{alias.upper()}_BACKEND (or CACHE_BACKEND) to "
+            "file, db or redis, or WEB_CONCURRENCY to 1.",
+            id="core.E003",
+        )
+        for alias in get_local_cache_aliases()
+    ]
+
+
+@register()
+def check_replica_cache(app_configs, **kwargs):
+    """
+    Check that the replica router reads the bump times of the models from a
+    cache every process shares: a change made in another worker (or by a
+    management command) must keep reads of that model on the primary.
+    """
+    from .management.replica import replica_configured
+
+    if not replica_configured() or not isinstance(caches["default"], LocMemCache):
+        return []
+    return [
+        Error(
+            "A replica database is configured but the default cache is local "
+            "to each process: reads may go to the replica before it has a "
+            "change made in another process.",
+            hint="Set CACHE_DEFAULT_BACKEND (or CACHE_BACKEND) to file, db or redis.",
+            id="core.E004",
+        )
+    ]
+
+
+@register()
+def check_database_connections(app_configs, **kwargs):
+    """
+    Check the connection pool (or persistent connections) against the number
+    of concurrent requests gunicorn can serve and the connection limit of
+    the database server. Under ASGI a worker serves any number of requests
+    at once, each with its own connection, so only a pool bounds them.
+    """
+    errors = []
+    workers, threads = get_server_concurrency()
+    max_connections = config("DB_MAX_CONNECTIONS", cast=int, default=100)
+
+    for alias, database in settings.DATABASES.items():
+        pool = database.get("OPTIONS", {}).get("pool")
+        if not pool:
+            if settings.ASGI_SERVER:
+                if not database["ENGINE"].endswith("sqlite3"):
+                    errors.append(
+                        Warning(
+                            f"Database '{alias}' has no connection pool: under "
+                            "ASGI each concurrent request opens a connection of "
+                            "its own, with no limit.",
+                            hint="Use DB_POOL.",
+                            id="core.W004",
+                        )
+                    )
+            elif database.get("CONN_MAX_AGE") and workers * threads > max_connections:
+                errors.append(
+                    Warning(
+                        f"Database '{alias}' keeps up to {workers * threads} "
+                        f"persistent connections open ({workers} workers x "
+                        f"{threads} threads), more than DB_MAX_CONNECTIONS "
+                        f"({max_connections}).",
+                        hint="Lower WEB_CONCURRENCY/GUNICORN_THREADS or use DB_POOL.",
+                        id="core.W001",
+                    )
+                )
+            continue
+
+        if find_spec("psycopg_pool") is None:
+            errors.append(
+                Error(
+                    f"Database '{alias}' uses a connection pool but psycopg_pool "
+                    "isn't installed.",
+                    hint="Install psycopg[pool] or unset DB_POOL.",
+                    id="core.E001",
+                )
+            )
+
+        pool = pool if isinstance(pool, dict) else {}
+        min_size = pool.get("min_size", 4)
+        max_size = pool.get("max_size", min_size)
+        if min_size > max_size:
+            errors.append(
+                Error(
+                    f"Database '{alias}' pool min_size ({min_size}) is larger "
+                    f"than its max_size ({max_size}).",
+                    id="core.E002",
+                )
+            )
+        if max_size < threads and not settings.ASGI_SERVER:
+            errors.append(
+                Warning(
+                    f"Database '{alias}' pool max_size ({max_size}) is smaller "
+                    f"than GUNICORN_THREADS ({threads}): requests will wait up to "
+                    f"{pool.get('timeout', 30)}s for a connection under load.",
+                    hint="Set DB_POOL_MAX_SIZE to at least GUNICORN_THREADS.",
+                    id="core.W002",
+                )
+            )
+        if workers * max_size > max_connections:
+            errors.append(
+                Warning(
+                    f"Database '{alias}' pools can open {workers * max_size} "
+                    f"connections ({workers} workers x max_size {max_size}), "
+                    f"more than DB_MAX_CONNECTIONS ({max_connections}).",
+                    hint="Lower DB_POOL_MAX_SIZE or WEB_CONCURRENCY.",
+                    id="core.W003",
+                )
+            )
+    return errors
@@ -0,0 +1,142 @@
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.utils.cache import cc_delim_re
+from django.utils.decorators import method_decorator
+
+from ..management.cache import (
+    get_cache,
+    get_model_generations,
+    get_static_hash,
+    resolve_models,
+    track_models,
+)
+
+PAGE_CACHE_ALIAS = "templates"
+
+# Request headers that change the rendered page by default
+DEFAULT_VARY_HEADERS = ("HX-Request",)
+
+
+def is_cacheable_request(request):
+    """
+    Only anonymous GET/HEAD requests without a session or pending messages
+    are served from the page cache. Without a session cookie the user is
+    anonymous, so this never has to load the session or user.
+    """
+    if request.method not in ("GET", "HEAD"):
+        return False
+    if settings.SESSION_COOKIE_NAME in request.COOKIES:
+        return False
+    if getattr(settings, "MESSAGE_COOKIE_NAME", "messages") in request.COOKIES:
+        return False
+    return True
+
+
+def is_cacheable_response(request, response):
+    """
+    Don't store responses that are errors, set cookies, embed a CSRF token
+    or are explicitly marked private/no-store.
+    """
+    if response.status_code != 200 or response.cookies:
+        return False
+    if request.META.get("CSRF_COOKIE_NEEDS_UPDATE"):
+        return False
+    cache_control = set(cc_delim_re.split(response.get("Cache-Control", "")))
+    return not cache_control & {"private", "no-store", "no-cache"}
+
+
+def page_cache_key(request, models, vary_headers, vary_cookies, vary_query):
+    """
+    Build the page cache key from the host and path, the varied headers and
+    cookies, the generation counters of the models the page depends on and
+    the hash of the static files the page links to.
+    """
+    parts = [
+        request.scheme,
+        request.get_host(),
+        request.get_full_path() if vary_query else request.path,
+        *(request.headers.get(header, "") for header in vary_headers),
+        *(request.COOKIES.get(cookie, "") for cookie in vary_cookies),
+        *get_model_generations(models),
+        get_static_hash(),
+    ]
+    digest = hashlib.md5("|".join(map(str, parts)).encode()).hexdigest()
+    return f"page:{request.path}:{digest}"
+
+
+def cache_anonymous_page(
+    depends_on="",
+    vary_headers=DEFAULT_VARY_HEADERS,
+    vary_cookies=(),
+    vary_query=False,
+    timeout=DEFAULT_TIMEOUT,
+):
+    """
+    View decorator caching the full response for anonymous visitors.
+
+    Cached pages are invalidated through the generation counters of the
+    models in `depends_on` (see {% cached_fragment %}), not by a blanket TTL;
+    `timeout` only bounds how long an entry is kept and defaults to the
+    cache alias' TIMEOUT. The query string is ignored unless `vary_query` is
+    set, so tracking parameters don't fragment the cache.
+
+    Args:
+        depends_on (str): Space separated 'app_label.ModelName' labels
+        vary_headers (tuple): Request headers the page varies on
+        vary_cookies (tuple): Cookies the page varies on
+        vary_query (bool): Whether the query string is part of the key
+        timeout (int | None): Cache timeout in seconds
+    """
+
+    track_models(depends_on)
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not is_cacheable_request(request):
+                return view_func(request, *args, **kwargs)
+
+            page_cache = get_cache(PAGE_CACHE_ALIAS)
+            key = page_cache_key(
+                request,
+                resolve_models(depends_on),
+                vary_headers,
+                vary_cookies,
+                vary_query,
+            )
+            response = page_cache.get(key)
+            if response is not None:
+                response["X-Page-Cache"] = "hit"
+                return response
+
+            response = view_func(request, *args, **kwargs)
+            if callable(getattr(response, "render", None)):
+                response = response.render()
+
+            if request.method == "GET" and is_cacheable_response(request, response):
+                page_cache.set(key, response, timeout)
+                response["X-Page-Cache"] = "miss"
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def cache_anonymous_page_class(**options):
+    """
+    Class-based view version of `cache_anonymous_page`, applied to `dispatch`.
+
+    Usage:
+        @cache_anonymous_page_class(depends_on="core.ListItem core.ListCategory")
+        class FeaturesView(TemplateView): ...
+    """
+
+    def decorator(cls):
+        cls.dispatch = method_decorator(cache_anonymous_page(**options))(cls.dispatch)
+        return cls
+
+    return decorator
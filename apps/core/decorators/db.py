@@ -0,0 +1,73 @@
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.utils.decorators import method_decorator
+
+from ..management.replica import replica_reads
+
+
+def read_from_replica(view_func):
+    """
+    View decorator sending the view's reads to the replica database (see
+    ReplicaRouter). Template responses are rendered inside the view, so
+    the queries their templates make are covered too. Works on async views.
+    """
+    if iscoroutinefunction(view_func):
+
+        @wraps(view_func)
+        async def async_wrapper(request, *args, **kwargs):
+            # The async ORM runs queries in threads that inherit this context
+            with replica_reads():
+                return await view_func(request, *args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        with replica_reads():
+            response = view_func(request, *args, **kwargs)
+            if callable(getattr(response, "render", None)):
+                response = response.render()
+        return response
+
+    return wrapper
+
+
+def read_from_replica_class(cls):
+    """
+    Class-based view version of `read_from_replica`, applied to `dispatch`.
+
+    Usage:
+        @read_from_replica_class
+        class CategoryViewSet(ReadOnlyModelViewSet): ...
+    """
+    if cls.view_is_async:
+        dispatch = cls.dispatch
+
+        # dispatch() returns the async handler's coroutine: await it in here
+        async def async_dispatch(self, request, *args, **kwargs):
+            return await dispatch(self, request, *args, **kwargs)
+
+        cls.dispatch = method_decorator(read_from_replica)(async_dispatch)
+    else:
+        cls.dispatch = method_decorator(read_from_replica)(cls.dispatch)
+    return cls
+
+
+def query_budget(queries=None, ms=None):
+    """
+    Declare the most queries, and milliseconds of database time, a view
+    should need. QueryBudgetMiddleware logs the requests that go over it,
+    in place of QUERY_BUDGET_QUERIES/QUERY_BUDGET_MS. Works on function
+    and class-based views (including DRF views and viewsets).
+
+    Usage:
+        @query_budget(queries=10, ms=50)
+        def blog(request): ...
+    """
+
+    def decorator(view):
+        view.query_budget = {"queries": queries, "ms": ms}
+        return view
+
+    return decorator
@@ -0,0 +1,98 @@
+import logging
+import posixpath
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+from .config.bundles import BUNDLE_KINDS, bundle_config
+
+try:
+    from rcssmin import cssmin
+except ImportError:  # minification is optional; files are only concatenated
+    cssmin = None
+
+try:
+    from rjsmin import jsmin
+except ImportError:
+    jsmin = None
+
+logger = logging.getLogger(__name__)
+
+# url(...) references in CSS, quoted or not
+CSS_URL_RE = re.compile(r"""url\(\s*(["']?)([^"')]+)\1\s*\)""")
+
+
+def get_bundles_root():
+    return Path(settings.BUNDLES_ROOT)
+
+
+def rebase_css_urls(content, source_path, output_path):
+    """
+    Rewrite relative url() references of a stylesheet so they still resolve
+    from the bundle's location (e.g. icon fonts next to the vendor CSS).
+    """
+    source_dir = posixpath.dirname(source_path)
+    output_dir = posixpath.dirname(output_path)
+
+    def rebase(match):
+        quote, url = match.groups()
+        if url.startswith(("/", "#", "data:", "http:", "https:", "//")):
+            return match.group(0)
+        target = posixpath.normpath(posixpath.join(source_dir, url))
+        return f"url({quote}{posixpath.relpath(target, output_dir)}{quote})"
+
+    return CSS_URL_RE.sub(rebase, content)
+
+
+def build_bundle_content(name, kind):
+    """Concatenate (and minify, when rcssmin/rjsmin are installed) a bundle."""
+    output_path = bundle_config.get_output_path(name, kind)
+    parts = []
+    for path in bundle_config.get(name)[kind]:
+        filename = finders.find(path)
+        if not filename:
+            raise FileNotFoundError(f"Static file '{path}' of bundle '{name}' not found")
+        content = Path(filename).read_text(encoding="utf-8")
+
+        if kind == "css":
+            content = rebase_css_urls(content, path, output_path)
+            if cssmin is not None:
+                content = cssmin(content)
+        elif jsmin is not None:
+            content = jsmin(content)
+
+        parts.append(f"/* {path} */\n{content}")
+
+    # Scripts are separated by semicolons so no file can swallow the next one
+    separator = "\n" if kind == "css" else "\n;\n"
+    return separator.join(parts) + "\n"
+
+
+def build_bundles(dry_run=False):
+    """
+    Build every registered bundle into BUNDLES_ROOT, where collectstatic
+    picks them up and gives them content-hashed names. Bundles whose content
+    didn't change are not rewritten.
+
+    Returns:
+        list: (static path, written) of every bundle file
+    """
+    results = []
+    if not dry_run:
+        get_bundles_root().mkdir(parents=True, exist_ok=True)
+    for name, files in bundle_config.get_bundles().items():
+        for kind in BUNDLE_KINDS:
+            if not files[kind]:
+                continue
+            output_path = bundle_config.get_output_path(name, kind)
+            content = build_bundle_content(name, kind).encode()
+            target = get_bundles_root() / output_path
+
+            written = not target.is_file() or target.read_bytes() != content
+            if written and not dry_run:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(content)
+            results.append((output_path, written))
+    return results
@@ -0,0 +1,392 @@
+import logging
+import threading
+import time
+import uuid
+from collections import Counter
+from functools import lru_cache
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+
+logger = logging.getLogger(__name__)
+
+STAT_KINDS = ("hit", "miss", "stale")
+
+# Bump times are only needed while a change may still be replicating
+BUMP_TIME_TIMEOUT = 3600
+
+# Seconds between flushes of a process' counters to the cache
+STATS_FLUSH_INTERVAL = 10
+
+_stats_lock = threading.Lock()
+# key prefix -> counters not yet flushed, shared by the threads of a process
+_pending_stats = {}
+_last_stats_flush = {}
+
+
+def get_cache(alias):
+    """Get a cache by alias, falling back to the default cache if it isn't configured."""
+    try:
+        return caches[alias]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def _version_key(namespace):
+    return f"version:{namespace}"
+
+
+def _bumped_key(namespace):
+    return f"bumped:{namespace}"
+
+
+def get_version(namespace, alias="default"):
+    """
+    Get the current version number for a cache namespace.
+
+    Versions are time-based values rather than counters, so a version key
+    that was evicted never reuses a number that older data was stored under.
+    A missing version is created with `cache.add()`, which is atomic on
+    every backend CACHE_BACKEND offers, so concurrent callers agree on it.
+
+    Args:
+        namespace (str): Name of the group of cached values (e.g. 'contacts')
+        alias (str): Cache alias the version lives in
+    """
+    cache = caches[alias]
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace, alias="default"):
+    """
+    Invalidate every key built with `versioned_key()` for a namespace.
+
+    Writes a fresh time-based version rather than incrementing the current
+    one: incr is a read then a write on some backends (e.g. file), so two
+    concurrent bumps could both write the same next version, and whatever
+    was cached under it between them would outlive the second change.
+
+    Args:
+        namespace (str): Name of the group of cached values (e.g. 'contacts')
+        alias (str): Cache alias the version lives in
+    """
+    cache = caches[alias]
+    cache.set(_bumped_key(namespace), time.time(), BUMP_TIME_TIMEOUT)
+    version = time.time_ns()
+    cache.set(_version_key(namespace), version, None)
+    return version
+
+
+def get_bump_time(namespace, alias="default"):
+    """
+    Get the time (a Unix timestamp) a namespace's version was last bumped,
+    or 0 if it wasn't bumped within BUMP_TIME_TIMEOUT seconds.
+    """
+    return caches[alias].get(_bumped_key(namespace), 0)
+
+
+def versioned_key(namespace, *parts, alias="default"):
+    """
+    Build a cache key that changes whenever `bump_version()` is called for
+    the namespace.
+
+    Usage:
+        key = versioned_key("contacts", "snapshot")
+    """
+    version = get_version(namespace, alias)
+    return ":".join([namespace, str(version), *(str(part) for part in parts)])
+
+
+def get_versions(namespaces, alias="default"):
+    """
+    Get the current version numbers of several namespaces in one cache round
+    trip. Returns a list in the same order as `namespaces`.
+    """
+    cache = caches[alias]
+    keys = [_version_key(namespace) for namespace in namespaces]
+    found = cache.get_many(keys)
+    return [
+        found[key] if key in found else get_version(namespace, alias)
+        for key, namespace in zip(keys, namespaces)
+    ]
+
+
+async def aget_versions(namespaces, alias="default"):
+    """Async version of `get_versions()`, for async views."""
+    cache = caches[alias]
+    keys = [_version_key(namespace) for namespace in namespaces]
+    found = await cache.aget_many(keys)
+    versions = []
+    for key in keys:
+        if key not in found:
+            await cache.aadd(key, time.time_ns(), None)
+            found[key] = await cache.aget(key)
+        versions.append(found[key])
+    return versions
+
+
+def model_namespace(model):
+    """Version namespace holding the generation counter of a model."""
+    return f"model:{model._meta.label_lower}"
+
+
+@lru_cache(maxsize=None)
+def resolve_models(depends_on):
+    """
+    Resolve a space separated string of 'app_label.ModelName' labels to
+    model classes. Unknown labels are logged and skipped, so callers can name
+    models from optional apps.
+    """
+    models = []
+    for label in depends_on.split():
+        try:
+            models.append(apps.get_model(label))
+        except (LookupError, ValueError):
+            logger.warning(f"Unknown model '{label}' ignored")
+    return tuple(models)
+
+
+# Labels (lowercased) of the models whose generations cache keys depend on
+_tracked_labels = set()
+_tracked_collected = False
+
+
+def track_models(depends_on):
+    """
+    Declare that cache keys depend on the generations of some models, so
+    their changes bump them (see signals/generations.py). Changes to models
+    nothing depends on don't touch the cache.
+
+    Args:
+        depends_on (str | Iterable): Space separated 'app_label.ModelName'
+            labels, or model classes
+    """
+    if isinstance(depends_on, str):
+        labels = depends_on.split()
+    else:
+        labels = (model._meta.label for model in depends_on)
+    _tracked_labels.update(label.lower() for label in labels)
+
+
+def collect_tracked_models():
+    """
+    Track the models of every {% cached_fragment %} with a literal
+    depends_on in the project's templates, and load the URLconf so the views
+    (and their @cache_anonymous_page decorators) have tracked theirs.
+    """
+    from django.urls import get_resolver
+
+    from .templates import get_fragment_dependencies
+
+    get_resolver().url_patterns
+    for depends_on in get_fragment_dependencies():
+        track_models(depends_on)
+
+
+def is_tracked(model):
+    """Whether a cache key depends on the generation of the given model."""
+    global _tracked_collected
+    if not _tracked_collected:
+        collect_tracked_models()
+        _tracked_collected = True
+    return model._meta.label_lower in _tracked_labels
+
+
+def get_model_generations(models, alias="default"):
+    """
+    Get the generation counters of the given models. A model's generation
+    changes whenever one of its rows is saved or deleted, or one of its
+    many-to-many relations changes.
+    """
+    return get_versions([model_namespace(model) for model in models], alias)
+
+
+async def aget_model_generations(models, alias="default"):
+    """Async version of `get_model_generations()`, for async views."""
+    return await aget_versions([model_namespace(model) for model in models], alias)
+
+
+def bump_model_generation(model, alias="default"):
+    """Invalidate every cache entry that depends on the given model."""
+    return bump_version(model_namespace(model), alias)
+
+
+def get_static_hash():
+    """
+    Hash of the staticfiles manifest ('' without one). Cached markup holds
+    content-hashed static URLs, so its keys include this hash: a rebuild of
+    the assets then starts from fresh entries instead of serving links to
+    the previous files.
+    """
+    from django.contrib.staticfiles.storage import staticfiles_storage
+
+    return getattr(staticfiles_storage, "manifest_hash", "")
+
+
+def _stat_key(key, kind):
+    return f"stats:{key}:{kind}"
+
+
+def incr_counter(cache, key, delta=1):
+    """Increment a counter that never expires, creating it if it's missing."""
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, None):
+            cache.incr(key, delta)
+
+
+def count_stats(cache, key, **counts):
+    """
+    Add to the hit/miss/stale counters of a key, e.g. `hit=3, miss=1`.
+
+    Counts are kept in the process and added to the cache at most every
+    STATS_FLUSH_INTERVAL seconds per alias, so counting costs no round trip
+    per lookup.
+    """
+    prefix = cache.key_prefix
+    now = time.monotonic()
+    with _stats_lock:
+        pending = _pending_stats.setdefault(prefix, Counter())
+        for kind, count in counts.items():
+            pending[_stat_key(key, kind)] += count
+        if now - _last_stats_flush.setdefault(prefix, now) < STATS_FLUSH_INTERVAL:
+            return
+        _last_stats_flush[prefix] = now
+    flush_stats(cache)
+
+
+def flush_stats(cache):
+    """Add this process' pending counters of a cache to the shared ones."""
+    with _stats_lock:
+        pending = _pending_stats.pop(cache.key_prefix, {})
+    for stat_key, count in pending.items():
+        if count:
+            incr_counter(cache, stat_key, count)
+
+
+def record_stat(key, kind, alias="default"):
+    """Count a hit/miss/stale lookup of a key, when CACHE_STATS is set."""
+    if settings.CACHE_STATS:
+        count_stats(get_cache(alias), key, **{kind: 1})
+
+
+def get_stats(key, alias="default"):
+    """
+    Get the counters recorded by `get_or_refresh()` for a key, or by the
+    cache backends in `cache_backends` for the whole alias (key 'cache').
+    Counts still pending in other processes aren't included.
+
+    Returns:
+        dict: {'hit': int, 'miss': int, 'stale': int}
+    """
+    cache = get_cache(alias)
+    found = cache.get_many([_stat_key(key, kind) for kind in STAT_KINDS])
+    return {kind: found.get(_stat_key(key, kind), 0) for kind in STAT_KINDS}
+
+
+def _acquire_lock(cache, key, timeout):
+    """Try to take the refresh lock of a key. Returns a token, or None."""
+    token = uuid.uuid4().hex
+    if cache.add(f"{key}:lock", token, timeout):
+        return token
+    return None
+
+
+def _release_lock(cache, key, token):
+    lock_key = f"{key}:lock"
+    if cache.get(lock_key) == token:
+        cache.delete(lock_key)
+
+
+def _refresh(cache, key, compute, soft_ttl, hard_ttl):
+    value = compute()
+    cache.set(key, (value, time.time() + soft_ttl), hard_ttl)
+    return value
+
+
+def get_or_refresh(
+    key,
+    compute,
+    soft_ttl,
+    hard_ttl=None,
+    lock_timeout=30,
+    lock_wait=2.0,
+    alias="default",
+    stats_key=None,
+):
+    """
+    Stale-while-revalidate cache lookup with dogpile protection.
+
+    The value is stored together with a soft expiry time. Before that time it
+    is served as a plain hit. After it, exactly one caller (the one holding
+    the cache-based refresh lock) recomputes the value while every other
+    caller keeps getting the stale value. On a cold miss the callers without
+    the lock wait up to `lock_wait` seconds for the value to appear before
+    computing it themselves.
+
+    The refresh lock is a `cache.add()`, so only one caller gets it where
+    add is atomic: the locmem, database and Redis backends, and the file
+    backend of `file_cache` (CACHE_BACKEND="file"). Django's own file-based
+    backend checks then writes, so there every caller may recompute.
+
+    Args:
+        key (str): Cache key of the value
+        compute (callable): Zero-argument function returning a fresh value
+        soft_ttl (int): Seconds the value is considered fresh
+        hard_ttl (int | None): Seconds the (possibly stale) value is kept in
+            the cache. None keeps it until evicted.
+        lock_timeout (int): Seconds before an abandoned refresh lock expires
+        lock_wait (float): Seconds a caller waits for another worker on a miss
+        alias (str): Cache alias to use
+        stats_key (str | None): Key the hit/stale/miss counters are kept
+            under (see `manage.py cache_stats --key`), defaults to `key`.
+            Set it for keys that vary, so their counters add up.
+
+    Usage:
+        stats = get_or_refresh("dashboard:stats", build_stats, soft_ttl=60)
+    """
+    cache = get_cache(alias)
+    stats_key = stats_key or key
+    entry = cache.get(key)
+
+    if entry is not None:
+        value, soft_expires = entry
+        if time.time() < soft_expires:
+            record_stat(stats_key, "hit", alias)
+            return value
+
+        record_stat(stats_key, "stale", alias)
+        token = _acquire_lock(cache, key, lock_timeout)
+        if token is None:
+            return value
+        try:
+            return _refresh(cache, key, compute, soft_ttl, hard_ttl)
+        except Exception as e:
+            logger.error(f"Error refreshing cache key '{key}', serving stale: {e}")
+            return value
+        finally:
+            _release_lock(cache, key, token)
+
+    record_stat(stats_key, "miss", alias)
+    token = _acquire_lock(cache, key, lock_timeout)
+    if token is None:
+        # Another worker is computing the value: give it a moment
+        deadline = time.monotonic() + lock_wait
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            entry = cache.get(key)
+            if entry is not None:
+                return entry[0]
+        return _refresh(cache, key, compute, soft_ttl, hard_ttl)
+
+    try:
+        return _refresh(cache, key, compute, soft_ttl, hard_ttl)
+    finally:
+        _release_lock(cache, key, token)
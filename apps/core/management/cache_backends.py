@@ -0,0 +1,86 @@
+import threading
+from contextlib import contextmanager
+
+from django.core.cache.backends.db import DatabaseCache as BaseDatabaseCache
+from django.core.cache.backends.locmem import LocMemCache as BaseLocMemCache
+from django.core.cache.backends.redis import RedisCache as BaseRedisCache
+
+from .cache import count_stats
+from .cache import flush_stats as flush_pending_stats
+from .file_cache import FileBasedCache as BaseFileBasedCache
+
+# Key (under the alias' own prefix) the counters of an alias are stored at
+STATS_KEY = "cache"
+
+_missing = object()
+_local = threading.local()
+
+
+@contextmanager
+def uncounted():
+    """
+    Don't count the lookups made inside the block. Also wraps the backends'
+    own nested calls (e.g. get_many() calling get()), so a lookup is only
+    counted once, by the outermost call.
+    """
+    depth = getattr(_local, "depth", 0)
+    _local.depth = depth + 1
+    try:
+        yield depth == 0
+    finally:
+        _local.depth = depth
+
+
+class CacheStatsMixin:
+    """
+    Count the hits and misses of `get`/`get_many` lookups per cache alias.
+
+    Counters are kept in the process and added to `stats:cache:hit|miss`
+    in the alias' own cache (see `count_stats()` and `get_stats()`), so
+    counting costs no extra round trip per lookup. Values cached as None
+    count as hits.
+    """
+
+    def _count(self, hits, misses):
+        with uncounted():
+            count_stats(self, STATS_KEY, hit=hits, miss=misses)
+
+    def flush_stats(self):
+        """Add this process' pending counters to the shared ones."""
+        with uncounted():
+            flush_pending_stats(self)
+
+    def get(self, key, default=None, version=None):
+        with uncounted() as outermost:
+            value = super().get(key, _missing, version=version)
+        if outermost:
+            self._count(value is not _missing, value is _missing)
+        return default if value is _missing else value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        with uncounted() as outermost:
+            found = super().get_many(keys, version=version)
+        if outermost:
+            self._count(len(found), len(keys) - len(found))
+        return found
+
+    def incr(self, key, delta=1, version=None):
+        with uncounted():
+            return super().incr(key, delta, version=version)
+
+
+class LocMemCache(CacheStatsMixin, BaseLocMemCache):
+    pass
+
+
+class FileBasedCache(CacheStatsMixin, BaseFileBasedCache):
+    pass
+
+
+class DatabaseCache(CacheStatsMixin, BaseDatabaseCache):
+    pass
+
+
+class RedisCache(CacheStatsMixin, BaseRedisCache):
+    pass
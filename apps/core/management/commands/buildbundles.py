@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ..bundles import build_bundles
+
+
+class Command(BaseCommand):
+    help = (
+        "Concatenate and minify the registered static bundles into "
+        "BUNDLES_ROOT, ready for collectstatic to hash."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show which bundles would change without writing them.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            results = build_bundles(dry_run=options["dry_run"])
+        except FileNotFoundError as e:
+            raise CommandError(str(e))
+
+        for path, written in results:
+            status = "Built" if written else "Unchanged"
+            if written and options["dry_run"]:
+                status = "Would build"
+            self.stdout.write(f"{status}: {path}")
+
+        changed = sum(written for _, written in results)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{changed}/{len(results)} bundles changed in {settings.BUNDLES_ROOT}"
+            )
+        )
@@ -0,0 +1,91 @@
+import re
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template.utils import get_app_template_dirs
+
+from ..scss import build_entries, get_output_path
+
+# {% sass_src 'core/init/bootstrap/init.scss' %}
+SASS_SRC_RE = re.compile(r"""{%\s*sass_src\s+["']([^"']+)["']\s*%}""")
+
+
+class Command(BaseCommand):
+    help = (
+        "Incrementally compile the SCSS entries referenced by {% sass_src %} "
+        "tags: only entries whose imported files changed since the last build "
+        "are recompiled, in parallel."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--delete-files",
+            action="store_true",
+            help="Delete the generated *.css files instead of compiling.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recompile every entry, ignoring the dependency cache.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of compiler processes (default: CPU count).",
+        )
+
+    def handle(self, *args, **options):
+        entries = self.find_entries()
+
+        if options["delete_files"]:
+            deleted = 0
+            for entry in entries:
+                output = get_output_path(entry)
+                if output.is_file():
+                    output.unlink()
+                    deleted += 1
+            self.stdout.write(
+                self.style.SUCCESS(f"Deleted {deleted} generated *.css files.")
+            )
+            return
+
+        start = time.perf_counter()
+        try:
+            compiled, cached = build_entries(
+                entries, workers=options["workers"], force=options["force"]
+            )
+        except Exception as e:
+            raise CommandError(f"SCSS compilation failed: {e}")
+
+        for entry in compiled:
+            self.stdout.write(f"Compiled: {entry}")
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compiled {len(compiled)} SCSS entries ({len(cached)} unchanged) "
+                f"in {elapsed:.2f}s"
+            )
+        )
+
+    def find_entries(self):
+        """Find the SCSS files referenced by {% sass_src %} in every template."""
+        from sass_processor.storage import find_file
+
+        template_dirs = [Path(d) for t in settings.TEMPLATES for d in t.get("DIRS", [])]
+        template_dirs += [Path(d) for d in get_app_template_dirs("templates")]
+
+        entries = {}
+        for template_dir in template_dirs:
+            for template in template_dir.rglob("*.html"):
+                for path in SASS_SRC_RE.findall(template.read_text(encoding="utf-8")):
+                    if path in entries:
+                        continue
+                    filename = find_file(path)
+                    if not filename:
+                        self.stderr.write(f"SCSS file not found: {path} ({template})")
+                        continue
+                    entries[path] = filename
+        return sorted(entries.values())
@@ -1,9 +1,19 @@
-from django.core.management.base import BaseCommand
+import time
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
 from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from ..compress import compress_tree
 
 
 class Command(BaseCommand):
-    help = "Runs compilescss, collectstatic (ignoring *.scss), and compilescss --delete-files."
+    help = (
+        "Runs buildscss, buildbundles, collectstatic (ignoring *.scss) with content-hashed "
+        "names and a manifest, buildscss --delete-files, and precompresses "
+        "the collected files to .gz/.br."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -11,15 +21,59 @@ class Command(BaseCommand):
             action="store_true",
             help="Print the commands that would be run without executing them.",
         )
+        parser.add_argument(
+            "--no-compress",
+            action="store_true",
+            help="Skip writing precompressed .gz/.br variants.",
+        )
+        parser.add_argument(
+            "--force-compress",
+            action="store_true",
+            help="Recompress every file, even if its variants are up to date.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of compression processes (default: CPU count).",
+        )
 
     def handle(self, *args, **options):
         dry_run = options["dry_run"]
+        compress = not options["no_compress"]
 
         if dry_run:
-            print("Would run: compilescss")
+            print("Would run: buildscss")
+            print("Would run: buildbundles")
             print("Would run: collectstatic --ignore=*.scss --noinput")
-            print("Would run: compilescss --delete-files")
+            print("Would run: buildscss --delete-files")
+            if compress:
+                print(f"Would precompress files in {settings.STATIC_ROOT}")
         else:
-            call_command("compilescss")
+            call_command("buildscss")
+            call_command("buildbundles")
             call_command("collectstatic", ignore=["*.scss"], interactive=False)
-            call_command("compilescss", delete_files=True)
+            call_command("buildscss", delete_files=True)
+
+            if compress:
+                start = time.perf_counter()
+                compressed, skipped = compress_tree(
+                    settings.STATIC_ROOT,
+                    workers=options["workers"],
+                    force=options["force_compress"],
+                    immutable=self.get_hashed_names(),
+                )
+                elapsed = time.perf_counter() - start
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Precompressed {compressed} files ({skipped} unchanged) "
+                        f"in {elapsed:.2f}s"
+                    )
+                )
+
+    def get_hashed_names(self):
+        """Content-hashed file names from the static manifest, if there is one."""
+        if not hasattr(staticfiles_storage, "load_manifest"):
+            return set()
+        hashed_files, _ = staticfiles_storage.load_manifest()
+        return set(hashed_files.values())
@@ -0,0 +1,83 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+
+from ..cache import STAT_KINDS, _stat_key, get_stats
+from ..cache_backends import STATS_KEY, CacheStatsMixin, uncounted
+
+
+def format_rate(stats):
+    total = sum(stats.values())
+    if not total:
+        return "-"
+    return f"{100 * (total - stats['miss']) / total:.1f}%"
+
+
+class Command(BaseCommand):
+    help = (
+        "Report the hit rate of every cache alias, and of keys served by "
+        "get_or_refresh(). Counters are shared through the cache itself, so "
+        "locmem aliases only show this process' lookups."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--key",
+            action="append",
+            dest="keys",
+            default=[],
+            help="Also report the counters of this get_or_refresh() key (repeatable).",
+        )
+        parser.add_argument(
+            "--alias",
+            default="default",
+            help="Cache alias the --key counters live in (default: default).",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the reported counters to zero.",
+        )
+
+    def handle(self, *args, **options):
+        with uncounted():
+            self.report(options)
+
+    def report(self, options):
+        for alias, cache_settings in settings.CACHES.items():
+            cache = caches[alias]
+            backend = cache_settings["BACKEND"].rsplit(".", 1)[1]
+            label = f"{alias} ({backend} {cache_settings.get('LOCATION', '')})"
+
+            if not isinstance(cache, CacheStatsMixin):
+                self.stdout.write(f"{label}: not counted, enable CACHE_STATS")
+                continue
+
+            try:
+                cache.flush_stats()
+                stats = get_stats(STATS_KEY, alias)
+                if options["reset"]:
+                    self.reset(alias, STATS_KEY)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"{label}: unavailable ({e})"))
+                continue
+
+            self.stdout.write(
+                f"{label}: {stats['hit']} hits, {stats['miss']} misses, "
+                f"hit rate {format_rate(stats)}"
+            )
+
+        for key in options["keys"]:
+            stats = get_stats(key, options["alias"])
+            if options["reset"]:
+                self.reset(options["alias"], key)
+            self.stdout.write(
+                f"{key}: {stats['hit']} hits, {stats['stale']} stale, "
+                f"{stats['miss']} misses, hit rate {format_rate(stats)}"
+            )
+
+        if options["reset"]:
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
+
+    def reset(self, alias, key):
+        caches[alias].delete_many([_stat_key(key, kind) for kind in STAT_KINDS])
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from ..sqlite import get_pragmas, read_pragmas
+
+
+class Command(BaseCommand):
+    help = (
+        "Print the PRAGMAs and transaction mode active on each SQLite "
+        "database, next to the values configured in SQLITE_PRAGMAS."
+    )
+
+    def handle(self, *args, **options):
+        configured = get_pragmas()
+        databases = [conn for conn in connections.all() if conn.vendor == "sqlite"]
+        if not databases:
+            self.stdout.write(self.style.WARNING("No SQLite databases configured."))
+            return
+
+        mismatches = 0
+        for conn in databases:
+            mode = conn.settings_dict.get("OPTIONS", {}).get("transaction_mode")
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(f"{conn.alias}: {conn.settings_dict['NAME']}")
+            )
+            self.stdout.write(f"  transaction_mode = {mode or 'DEFERRED'}")
+
+            active = read_pragmas(conn, [*configured, "foreign_keys"])
+            for name, value in active.items():
+                expected = configured.get(name)
+                if expected is None or str(value).lower() == str(expected).lower():
+                    self.stdout.write(f"  {name} = {value}")
+                else:
+                    mismatches += 1
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"  {name} = {value} (configured: {expected})"
+                        )
+                    )
+
+        if mismatches:
+            self.stdout.write(
+                self.style.WARNING(f"{mismatches} PRAGMAs differ from SQLITE_PRAGMAS.")
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("SQLite settings are active."))
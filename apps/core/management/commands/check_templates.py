@@ -0,0 +1,97 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ..templates import (
+    compile_templates,
+    get_project_template_names,
+    get_tree,
+    uses_cached_loader,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile the templates under apps/*/templates in parallel and report "
+        "the parse time and size of each one, with the totals over everything "
+        "it extends or includes. Slowest first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "names",
+            nargs="*",
+            help="Only check these templates (and their includes). Defaults to all.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of compiler processes (default: CPU count).",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Only list the N slowest templates.",
+        )
+        parser.add_argument(
+            "--max-ms",
+            type=float,
+            default=None,
+            help="Fail if any template's tree takes longer than this to parse.",
+        )
+
+    def handle(self, *args, **options):
+        names = options["names"] or get_project_template_names()
+        start = time.perf_counter()
+        results = compile_templates(names, workers=options["workers"])
+        elapsed = time.perf_counter() - start
+
+        trees = sorted(
+            ((name, get_tree(name, results)) for name in names if name in results),
+            key=lambda item: item[1]["parse_time"],
+            reverse=True,
+        )
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"{'tree ms':>9} {'tree KB':>8} {'files':>5} "
+                f"{'parse ms':>9} {'KB':>7}  template"
+            )
+        )
+        over_budget = []
+        for name, tree in trees[: options["limit"]]:
+            result = results[name]
+            line = (
+                f"{tree['parse_time'] * 1000:9.2f} {tree['size'] / 1024:8.1f} "
+                f"{tree['templates']:5} {result['parse_time'] * 1000:9.2f} "
+                f"{result['size'] / 1024:7.1f}  {name}"
+            )
+            if options["max_ms"] is not None and tree["parse_time"] * 1000 > options["max_ms"]:
+                over_budget.append(name)
+                line = self.style.WARNING(line)
+            self.stdout.write(line)
+
+        failed = [result for result in results.values() if result["error"]]
+        for result in failed:
+            self.stdout.write(self.style.ERROR(f"{result['name']}: {result['error']}"))
+
+        if not uses_cached_loader():
+            self.stdout.write(
+                self.style.WARNING(
+                    "The template loaders aren't cached: every render parses its "
+                    "whole tree again."
+                )
+            )
+
+        if failed:
+            raise CommandError(f"{len(failed)} templates failed to compile.")
+        if over_budget:
+            raise CommandError(
+                f"{len(over_budget)} templates take longer than "
+                f"{options['max_ms']} ms to parse."
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Compiled {len(results)} templates in {elapsed:.2f}s")
+        )
@@ -70,6 +70,8 @@ ROOT_URLCONF="settings.core.urls"
 ENVIRONMENT="development"
 SECRET_KEY="{secret_key}"
 ALLOWED_HOSTS="localhost,127.0.0.1"
+# TEMPLATE_CACHE="True"
+# DJANGO_ASGI="False"
 
 # 🗄️ Database Configuration
 # DB_BACKEND="sqlite3"
@@ -78,6 +80,34 @@ ALLOWED_HOSTS="localhost,127.0.0.1"
 # DB_PASSWORD="postgres"
 # DB_HOST="localhost"
 # DB_PORT="5432"
+# DB_CONN_MAX_AGE="60"
+# DB_CONN_HEALTH_CHECKS="True"
+# DB_POOL="False"
+# DB_POOL_MIN_SIZE="2"
+# DB_POOL_MAX_SIZE="4"
+# DB_POOL_TIMEOUT="10"
+# DB_MAX_CONNECTIONS="100"
+# DB_REPLICA_HOST=""
+# DB_REPLICA_NAME=""
+# DB_REPLICA_USER=""
+# DB_REPLICA_PASSWORD=""
+# DB_REPLICA_PORT=""
+# DB_REPLICA_LAG="5"
+# SQLITE_TRANSACTION_MODE="IMMEDIATE"
+# SQLITE_JOURNAL_MODE="wal"
+# SQLITE_SYNCHRONOUS="normal"
+# SQLITE_BUSY_TIMEOUT="5000"
+# SQLITE_CACHE_SIZE="-20000"
+# SQLITE_MMAP_SIZE="134217728"
+# SQLITE_TEMP_STORE="memory"
+
+# ⚡ Cache Configuration
+# CACHE_BACKEND="file"
+# CACHE_LOCATION=""
+# CACHE_SESSIONS_BACKEND="db"
+# CACHE_KEY_PREFIX="dms"
+# CACHE_VERSION="1"
+# CACHE_STATS="True"
 
 # 📧 Email Configuration
 # EMAIL_BACKEND="django.core.mail.backends.console.EmailBackend"
@@ -104,6 +134,34 @@ ALLOWED_HOSTS="localhost,127.0.0.1"
 # SITE_MSTILE="/lib/static/core/img/mstile.png"
 # SITE_HERO="/lib/static/core/img/hero.jpg"
 # SITE_MANIFEST="/lib/static/core/manifest.webmanifest"
+
+# 📦 Static Files
+# STATIC_WORKERS="8"
+# STATIC_BUNDLES="False"
+# SERVE_STATIC="False"
+# STATIC_MAX_AGE="60"
+
+# 📰 Pre-rendered Pages
+# PUBLISH_ROOT=""
+# PUBLISH_ON_SAVE="False"
+
+# 🔍 Query Budgets
+# QUERY_BUDGET_SAMPLE_RATE="1"
+# QUERY_BUDGET_QUERIES="50"
+# QUERY_BUDGET_MS="200"
+# QUERY_BUDGET_REPEATS="5"
+# QUERY_BUDGET_SERVER_TIMING="True"
+
+# 🦄 Server (Gunicorn)
+# GUNICORN_BIND="127.0.0.1:8000"
+# WEB_CONCURRENCY=""
+# GUNICORN_THREADS="1"
+# GUNICORN_TIMEOUT="30"
+# GUNICORN_MAX_REQUESTS="1000"
+# GUNICORN_MAX_REQUESTS_JITTER="100"
+# GUNICORN_PRELOAD="True"
+# GUNICORN_WARMUP="False"
+# GUNICORN_WORKER_TMP_DIR="/dev/shm"
 """
 
         try:
@@ -1,9 +1,17 @@
 """
 Django management command for managing npm packages in a vendor directory.
 
+Packages are installed into a build directory outside the static tree
+(lib/npm by default) and only the files listed in VENDOR_FILES are copied
+into the static vendor directory, so collectstatic never walks whole
+node_modules trees. Downloaded tarballs are kept in a local npm cache,
+which `--offline` installs from without network access.
+
 Usage:
     python manage.py npm install
+    python manage.py npm install --offline
     python manage.py npm install --packages react vue
+    python manage.py npm extract
     python manage.py npm uninstall --packages lodash
     python manage.py npm uninstall --all
     python manage.py npm list
@@ -11,12 +19,20 @@ Usage:
 
 import json
 import os
+import re
 import shutil
 import subprocess
 from pathlib import Path
 from typing import Dict, List
 
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
+from django.template.utils import get_app_template_dirs
+
+from ..config.bundles import bundle_config
+
+# {% static 'core/vendor/node_modules/<package>/<file>' %} or a SCSS @import
+VENDOR_REFERENCE_RE = re.compile(r"""vendor/node_modules/([^'"\s]+)""")
 
 
 class Command(BaseCommand):
@@ -36,6 +52,33 @@ class Command(BaseCommand):
         "waypoints",
     ]
 
+    # Files (globs relative to the package root) copied into the static vendor
+    # directory. Keep these in sync with the templates in core/vendors/ and
+    # the SCSS imports in core/init/.
+    VENDOR_FILES = {
+        "bootstrap": [
+            "dist/js/bootstrap.bundle.min.js",
+            "dist/js/bootstrap.bundle.min.js.map",
+            "scss/**/*.scss",
+        ],
+        "bootstrap-icons": [
+            "font/bootstrap-icons.min.css",
+            "font/fonts/*",
+        ],
+        "aos": ["dist/aos.css", "dist/aos.js"],
+        "htmx.org": ["dist/htmx.min.js"],
+        "glightbox": ["dist/css/glightbox.min.css", "dist/js/glightbox.min.js"],
+        "isotope-layout": ["dist/isotope.pkgd.min.js"],
+        "imagesloaded": ["imagesloaded.pkgd.min.js"],
+        "waypoints": ["lib/noframework.waypoints.min.js"],
+    }
+
+    # Copied for every package, to keep version and license information
+    ALWAYS_COPY = ["package.json", "LICENSE*"]
+
+    # Used for packages without a VENDOR_FILES entry
+    DEFAULT_VENDOR_FILES = ["dist/**/*"]
+
     def add_arguments(self, parser):
         """Add command line arguments."""
         subparsers = parser.add_subparsers(
@@ -50,6 +93,22 @@ class Command(BaseCommand):
             help="Specific packages to install (default: install default packages)",
         )
         install_parser.add_argument(
+            "--offline",
+            action="store_true",
+            help="Install only from the local tarball cache, without network access",
+        )
+        install_parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show what would be done without executing",
+        )
+
+        # Extract command
+        extract_parser = subparsers.add_parser(
+            "extract",
+            help="Copy the vendored files of installed packages into static",
+        )
+        extract_parser.add_argument(
             "--dry-run",
             action="store_true",
             help="Show what would be done without executing",
@@ -82,6 +141,11 @@ class Command(BaseCommand):
             default="vendor",
             help="Vendor directory name (default: vendor)",
         )
+        parser.add_argument(
+            "--build-dir",
+            default=None,
+            help="Directory npm installs into (default: lib/npm)",
+        )
 
     def handle(self, *args, **options):
         """Main command handler."""
@@ -93,22 +157,25 @@ class Command(BaseCommand):
         core_dir = current_file.parent.parent.parent  # Navigate up to core/
         vendor_dir_name = options["vendor_dir"]
         self.vendor_path = core_dir / "static" / "core" / vendor_dir_name
-        self.package_json_path = self.vendor_path / "package.json"
+        self.build_path = Path(options["build_dir"] or settings.LIB_DIR / "npm")
+        self.cache_path = self.build_path / "cache"
+        self.package_json_path = self.build_path / "package.json"
 
         # Find npm executable
+        action = options["action"]
         self.npm_cmd = self._find_npm()
-        if not self.npm_cmd and not self.dry_run:
+        if not self.npm_cmd and not self.dry_run and action != "extract":
             raise CommandError(
                 "npm not found. Please install Node.js and npm first, "
                 "or ensure npm is in your system PATH."
             )
 
         # Execute the requested action
-        action = options["action"]
-
         try:
             if action == "install":
                 self.handle_install(options)
+            elif action == "extract":
+                self.handle_extract()
             elif action == "uninstall":
                 self.handle_uninstall(options)
             elif action == "list":
@@ -162,8 +229,8 @@ class Command(BaseCommand):
         self._ensure_vendor_dir()
         self._init_package_json()
 
-        # Install packages
-        install_cmd = ["install"] + packages
+        # Install packages, reusing cached tarballs whenever possible
+        install_cmd = ["install"] + packages + self._cache_args(options["offline"])
         success = self._run_npm_command(install_cmd)
 
         if success and not self.dry_run and self.verbosity >= 1:
@@ -178,6 +245,133 @@ class Command(BaseCommand):
                 self.style.WARNING("[DRY RUN] Installation completed successfully")
             )
 
+        if success and not self.dry_run:
+            self.handle_extract()
+        elif success and self.verbosity >= 1:
+            self.stdout.write(
+                f"[DRY RUN] Would copy vendored files into {self.vendor_path}"
+            )
+
+    def handle_extract(self):
+        """Handle extract command."""
+        installed = self._get_installed_packages()
+        if not installed:
+            raise CommandError(
+                f"No packages installed in {self.build_path}. Run 'npm install' first."
+            )
+
+        target_root = self.vendor_path / "node_modules"
+        if self.dry_run:
+            for pkg in installed:
+                patterns = self.VENDOR_FILES.get(pkg, self.DEFAULT_VENDOR_FILES)
+                self.stdout.write(
+                    f"[DRY RUN] Would copy {', '.join(patterns)} of {pkg} "
+                    f"to {target_root / pkg}"
+                )
+            return
+
+        self._remove_legacy_install()
+        if target_root.exists():
+            shutil.rmtree(target_root)
+
+        total_files = total_size = 0
+        for pkg in installed:
+            files, size = self._extract_package(pkg, target_root / pkg)
+            total_files += files
+            total_size += size
+
+        if self.verbosity >= 1:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Extracted {total_files} files ({total_size / 1024:.0f} KiB) "
+                    f"into {target_root}"
+                )
+            )
+        self._check_references(target_root)
+
+    def _cache_args(self, offline=False) -> List[str]:
+        """npm flags to install from (and fill) the local tarball cache."""
+        return [
+            "--cache",
+            str(self.cache_path),
+            "--offline" if offline else "--prefer-offline",
+            "--no-audit",
+            "--no-fund",
+        ]
+
+    def _extract_package(self, pkg: str, target: Path):
+        """Copy the vendored files of one package. Returns (files, bytes) copied."""
+        source = self.build_path / "node_modules" / pkg
+        if not source.is_dir():
+            self.stderr.write(f"Package {pkg} is not installed in {self.build_path}")
+            return 0, 0
+
+        patterns = self.VENDOR_FILES.get(pkg)
+        if patterns is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"No VENDOR_FILES entry for {pkg}, copying {', '.join(self.DEFAULT_VENDOR_FILES)}"
+                )
+            )
+            patterns = self.DEFAULT_VENDOR_FILES
+
+        files = set()
+        for pattern in self.ALWAYS_COPY + patterns:
+            matches = [path for path in source.glob(pattern) if path.is_file()]
+            if not matches and pattern not in self.ALWAYS_COPY:
+                self.stderr.write(f"No files match '{pattern}' in {pkg}")
+            files.update(matches)
+
+        size = 0
+        for path in files:
+            destination = target / path.relative_to(source)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, destination)
+            size += path.stat().st_size
+
+        if self.verbosity >= 2:
+            self.stdout.write(f"  - {pkg}: {len(files)} files")
+        return len(files), size
+
+    def _remove_legacy_install(self):
+        """Remove npm files left by installs made directly into the vendor directory."""
+        for name in ("package.json", "package-lock.json"):
+            legacy = self.vendor_path / name
+            if legacy.exists():
+                legacy.unlink()
+                if self.verbosity >= 1:
+                    self.stdout.write(f"Removed legacy {legacy}")
+
+    def _check_references(self, target_root: Path):
+        """Warn about vendor files used by templates, SCSS or bundles but not extracted."""
+        sources = []
+        for template_dir in get_app_template_dirs("templates"):
+            sources.extend(Path(template_dir).rglob("*.html"))
+        sources.extend((self.vendor_path.parent / "init").rglob("*.scss"))
+
+        references = [
+            (source.name, reference)
+            for source in sources
+            for reference in VENDOR_REFERENCE_RE.findall(
+                source.read_text(encoding="utf-8")
+            )
+        ]
+        for name, files in bundle_config.get_bundles().items():
+            for path in files["css"] + files["js"]:
+                references += [
+                    (f"bundle '{name}'", reference)
+                    for reference in VENDOR_REFERENCE_RE.findall(path)
+                ]
+
+        for source, reference in references:
+            if not (target_root / reference).is_file():
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{source} references {reference}, which is not "
+                        "vendored (not installed, or missing from VENDOR_FILES)."
+                    )
+                )
+
     def handle_uninstall(self, options):
         """Handle uninstall command."""
         if options.get("all"):
@@ -197,22 +391,27 @@ class Command(BaseCommand):
             return
 
         if self.verbosity >= 1:
-            self.stdout.write(f"Installed packages in {self.vendor_path}:")
+            self.stdout.write(f"Installed packages in {self.build_path}:")
             for pkg, version in installed.items():
                 self.stdout.write(f"  - {pkg}@{version}")
             self.stdout.write(self.style.SUCCESS(f"Total: {len(installed)} packages"))
 
     def _ensure_vendor_dir(self):
-        """Ensure the vendor directory exists."""
+        """Ensure the vendor and npm build directories exist."""
         if not self.dry_run:
             self.vendor_path.mkdir(parents=True, exist_ok=True)
+            self.build_path.mkdir(parents=True, exist_ok=True)
             if self.verbosity >= 2:
                 self.stdout.write(f"Ensured vendor directory: {self.vendor_path}")
+                self.stdout.write(f"Ensured build directory: {self.build_path}")
         else:
             if self.verbosity >= 1:
                 self.stdout.write(
                     f"[DRY RUN] Would create directory: {self.vendor_path}"
                 )
+                self.stdout.write(
+                    f"[DRY RUN] Would create directory: {self.build_path}"
+                )
 
     def _init_package_json(self):
         """Initialize package.json if it doesn't exist."""
@@ -239,20 +438,20 @@ class Command(BaseCommand):
                     )
 
     def _run_npm_command(self, cmd: List[str]) -> bool:
-        """Run an npm command in the vendor directory."""
-        full_cmd = [self.npm_cmd] + cmd
+        """Run an npm command in the build directory."""
+        full_cmd = [self.npm_cmd or "npm"] + cmd
 
         if self.dry_run:
             if self.verbosity >= 1:
                 self.stdout.write(
-                    f"[DRY RUN] Would run: {' '.join(full_cmd)} in {self.vendor_path}"
+                    f"[DRY RUN] Would run: {' '.join(full_cmd)} in {self.build_path}"
                 )
             return True
 
         try:
             if self.verbosity >= 2:
                 self.stdout.write(
-                    f"Running: {' '.join(full_cmd)} in {self.vendor_path}"
+                    f"Running: {' '.join(full_cmd)} in {self.build_path}"
                 )
                 self.stdout.write(f"Using npm at: {self.npm_cmd}")
 
@@ -261,7 +460,7 @@ class Command(BaseCommand):
 
             result = subprocess.run(
                 full_cmd,
-                cwd=self.vendor_path,
+                cwd=self.build_path,
                 capture_output=True,
                 text=True,
                 check=True,
@@ -299,8 +498,8 @@ class Command(BaseCommand):
 
     def _uninstall_packages(self, packages: List[str]):
         """Uninstall specific npm packages."""
-        if not self.vendor_path.exists():
-            raise CommandError(f"Vendor directory {self.vendor_path} does not exist.")
+        if not self.build_path.exists():
+            raise CommandError(f"Build directory {self.build_path} does not exist.")
 
         if self.verbosity >= 1:
             self.stdout.write(f"Uninstalling packages: {', '.join(packages)}")
@@ -308,6 +507,13 @@ class Command(BaseCommand):
         uninstall_cmd = ["uninstall"] + packages
         success = self._run_npm_command(uninstall_cmd)
 
+        if success and not self.dry_run:
+            # Drop the vendored copies too
+            for pkg in packages:
+                target = self.vendor_path / "node_modules" / pkg
+                if target.exists():
+                    shutil.rmtree(target)
+
         if success and not self.dry_run and self.verbosity >= 1:
             self.stdout.write(
                 self.style.SUCCESS(f"Successfully uninstalled: {', '.join(packages)}")
@@ -318,8 +524,17 @@ class Command(BaseCommand):
             )
 
     def _uninstall_all(self):
-        """Uninstall all packages by removing the vendor directory."""
-        if not self.vendor_path.exists():
+        """
+        Uninstall all packages by removing the vendor directory and the
+        installed packages. The tarball cache is kept for offline installs.
+        """
+        build_files = [
+            self.build_path / "node_modules",
+            self.build_path / "package.json",
+            self.build_path / "package-lock.json",
+        ]
+        targets = [self.vendor_path] + build_files
+        if not any(target.exists() for target in targets):
             if self.verbosity >= 1:
                 self.stdout.write(
                     f"Vendor directory {self.vendor_path} does not exist."
@@ -331,12 +546,17 @@ class Command(BaseCommand):
                 self.stdout.write(
                     f"[DRY RUN] Would remove entire vendor directory: {self.vendor_path}"
                 )
+                self.stdout.write(
+                    f"[DRY RUN] Would remove installed packages in: {self.build_path}"
+                )
             return
 
         try:
-            import shutil
-
-            shutil.rmtree(self.vendor_path)
+            for target in targets:
+                if target.is_dir():
+                    shutil.rmtree(target)
+                elif target.exists():
+                    target.unlink()
             if self.verbosity >= 1:
                 self.stdout.write(
                     self.style.SUCCESS(f"Removed vendor directory: {self.vendor_path}")
@@ -0,0 +1,73 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ..config.publish import publish_config
+from ..publish import clear_published, get_client, get_route_pages, publish_page
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-render the registered public pages to static HTML (with .gz/.br "
+        "siblings) under PUBLISH_ROOT, for the front proxy to serve directly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "url_names",
+            nargs="*",
+            help="Only render these routes (URL names). Defaults to all registered routes.",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Remove every published page before rendering.",
+        )
+        parser.add_argument(
+            "--no-compress",
+            action="store_true",
+            help="Don't write precompressed .gz/.br variants.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the pages that would be rendered without writing them.",
+        )
+
+    def handle(self, *args, **options):
+        routes = publish_config.get_routes(options["url_names"])
+        if not routes:
+            self.stdout.write(self.style.WARNING("No routes registered for publishing."))
+            return
+
+        pages = [path for route in routes for path in get_route_pages(route)]
+
+        if options["dry_run"]:
+            for path in pages:
+                self.stdout.write(f"Would render: {path}")
+            return
+
+        if options["clear"]:
+            clear_published()
+
+        client, secure = get_client()
+        start = time.perf_counter()
+        published = 0
+        for path in pages:
+            target = publish_page(
+                path, client, secure, compress=not options["no_compress"]
+            )
+            if target is None:
+                self.stdout.write(self.style.WARNING(f"Skipped: {path}"))
+            else:
+                published += 1
+                self.stdout.write(f"Rendered: {path}")
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Published {published}/{len(pages)} pages to "
+                f"{settings.PUBLISH_ROOT} in {elapsed:.2f}s"
+            )
+        )
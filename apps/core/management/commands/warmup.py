@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ..warmup import PHASES, warmup
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile the templates, populate the URL resolvers, render the "
+        "navigation menu, open the database connections and fill the "
+        "application caches, reporting how long each phase takes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "phases",
+            nargs="*",
+            help=f"Only run these phases ({', '.join(PHASES)}). Defaults to all.",
+        )
+
+    def handle(self, *args, **options):
+        unknown = set(options["phases"]) - set(PHASES)
+        if unknown:
+            raise CommandError(f"Unknown phases: {', '.join(sorted(unknown))}")
+
+        start = time.perf_counter()
+        for phase, elapsed, detail in warmup(options["phases"]):
+            self.stdout.write(f"{phase:<12} {elapsed * 1000:8.1f} ms  {detail}")
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(f"Warmed up in {elapsed:.2f}s"))
@@ -0,0 +1,165 @@
+import gzip
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # a main dependency; only .gz variants are written without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Files smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 256
+
+COMPRESSIBLE_EXTENSIONS = {
+    ".css",
+    ".js",
+    ".mjs",
+    ".json",
+    ".map",
+    ".html",
+    ".txt",
+    ".xml",
+    ".svg",
+    ".ico",
+    ".webmanifest",
+    ".ttf",
+    ".otf",
+    ".eot",
+}
+
+
+def is_compressible(path):
+    """Check whether a file type benefits from precompression."""
+    return Path(path).suffix.lower() in COMPRESSIBLE_EXTENSIONS
+
+
+def write_atomic(path, data):
+    """Write bytes to a temporary sibling and move it into place."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def write_compressed_variants(path, data=None):
+    """
+    Write precompressed `.gz` (and `.br`, when brotli is installed) siblings
+    of a file, so a front proxy or the static middleware can serve them
+    directly. Variants that would not be smaller than the original are
+    removed instead.
+
+    Args:
+        path (str | Path): The original file
+        data (bytes | None): Its content, read from disk if not given
+
+    Returns:
+        list[Path]: The variants written
+    """
+    path = Path(path)
+    if data is None:
+        data = path.read_bytes()
+
+    encoders = [(".gz", lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.append((".br", lambda d: brotli.compress(d, quality=11)))
+
+    written = []
+    for suffix, encode in encoders:
+        variant = path.with_name(path.name + suffix)
+        compressed = encode(data) if len(data) >= MIN_COMPRESS_SIZE else None
+        if compressed is not None and len(compressed) < len(data):
+            write_atomic(variant, compressed)
+            written.append(variant)
+        else:
+            variant.unlink(missing_ok=True)
+    return written
+
+
+def get_state_file(root):
+    """
+    State of the last `compress_tree()` run over a directory, kept next to
+    it (e.g. lib/.static.compressed.json) so it isn't served with the files.
+    """
+    root = Path(root)
+    return root.with_name(f".{root.name}.compressed.json")
+
+
+def load_state(root):
+    try:
+        return json.loads(get_state_file(root).read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def file_state(path, variants):
+    """What a file was compressed from: its mtime and size, and whether a .gz was kept."""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size, any(v.suffix == ".gz" for v in variants)]
+
+
+def is_compressed(path, entry, immutable=False):
+    """
+    Check whether a file was already compressed, going by its entry in the
+    state file. Files whose variants weren't worth keeping (too small or
+    incompressible) have an entry too, so they aren't tried again. Immutable
+    (content-hashed) files only need an entry: collectstatic rewrites them
+    on every run without changing them.
+    """
+    if entry is None:
+        return False
+    mtime_ns, size, has_gz = entry
+    if has_gz and not path.with_name(path.name + ".gz").is_file():
+        return False
+    if immutable:
+        return True
+    stat = path.stat()
+    return stat.st_mtime_ns == mtime_ns and stat.st_size == size
+
+
+def compress_tree(root, workers=None, force=False, immutable=()):
+    """
+    Precompress every compressible file under a directory in a process pool.
+    Files compressed (or found not worth compressing) by an earlier run and
+    unchanged since are skipped, so rebuilding an unchanged tree only costs
+    a directory walk.
+
+    Args:
+        root (str | Path): Directory to walk (e.g. STATIC_ROOT)
+        workers (int | None): Worker processes, defaults to the CPU count
+        force (bool): Recompress files even if their variants are up to date
+        immutable (Container[str]): Paths, relative to root, whose content
+            never changes (e.g. the hashed names from the static manifest)
+
+    Returns:
+        tuple: (compressed, skipped) file counts
+    """
+    root = Path(root)
+    state = {} if force else load_state(root)
+    files = {
+        path.relative_to(root).as_posix(): path
+        for path in root.rglob("*")
+        if path.is_file() and is_compressible(path)
+    }
+    pending = [
+        name
+        for name, path in files.items()
+        if not is_compressed(path, state.get(name), name in immutable)
+    ]
+
+    if pending:
+        paths = [files[name] for name in pending]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(write_compressed_variants, paths, chunksize=16)
+            for name, path, variants in zip(pending, paths, results):
+                state[name] = file_state(path, variants)
+
+    # Forget removed files
+    state = {name: entry for name, entry in state.items() if name in files}
+    write_atomic(get_state_file(root), json.dumps(state).encode())
+    return len(pending), len(files) - len(pending)
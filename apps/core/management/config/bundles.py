@@ -0,0 +1,51 @@
+# config/bundles.py
+from django.core.exceptions import ImproperlyConfigured
+
+BUNDLE_KINDS = ("css", "js")
+
+
+class BundleConfig:
+    """
+    Registry of static bundles: named groups of CSS and JS files that are
+    concatenated and minified by `buildbundles` and emitted by the
+    {% bundle %} template tag.
+
+    Only group files that are loaded unconditionally together: the scripts
+    of a bundle run as one, so an error in one file stops the files after it.
+    """
+
+    def __init__(self):
+        self._bundles = {}
+
+    def register(self, name, css=(), js=()):
+        """
+        Register a bundle, or append files to an existing one.
+
+        Args:
+            name: Bundle name used in {% bundle "name" %}
+            css: Static paths of the stylesheets, in cascade order
+            js: Static paths of the scripts, in execution order
+        """
+        bundle = self._bundles.setdefault(name, {"css": [], "js": []})
+        bundle["css"].extend(css)
+        bundle["js"].extend(js)
+
+    def get(self, name):
+        """Get the files of a bundle: {'css': [...], 'js': [...]}."""
+        try:
+            return self._bundles[name]
+        except KeyError:
+            raise ImproperlyConfigured(f"Static bundle '{name}' is not registered.")
+
+    def get_bundles(self):
+        """Get every registered bundle by name."""
+        return dict(self._bundles)
+
+    @staticmethod
+    def get_output_path(name, kind):
+        """Static path of a built bundle, e.g. 'core/bundles/core.js'."""
+        return f"core/bundles/{name}.{kind}"
+
+
+# Global config instance
+bundle_config = BundleConfig()
@@ -1,9 +1,13 @@
 # config/navigation.py
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 
 class NavigationConfig:
     def __init__(self):
         self._items = []
+        # Rendered menu HTML keyed by (urlconf, script prefix, nav type, icon class, auth state)
+        self._rendered = {}
 
     def register(
         self,
@@ -44,6 +48,7 @@ class NavigationConfig:
             **kwargs,
         }
         self._items.append(item)
+        self.invalidate()
 
     def register_dropdown(
         self, name, icon="", order=0, type="", auth_status="any", **kwargs
@@ -51,7 +56,9 @@ class NavigationConfig:
         """
         Register a dropdown parent item without a direct URL.
 
-        Returns the item so you can add children to it.
+        Returns the item so you can add children to it. Prefer
+        add_dropdown_item() for that, since it also invalidates the
+        rendered menu cache.
         """
         item = {
             "name": name,
@@ -66,6 +73,7 @@ class NavigationConfig:
             **kwargs,
         }
         self._items.append(item)
+        self.invalidate()
         return item
 
     def add_dropdown_item(
@@ -101,6 +109,7 @@ class NavigationConfig:
                     **kwargs,
                 }
                 item["dropdown_items"].append(child_item)
+                self.invalidate()
                 return
 
         # If parent doesn't exist, create it
@@ -114,14 +123,35 @@ class NavigationConfig:
             **kwargs,
         }
         parent["dropdown_items"].append(child_item)
+        self.invalidate()
 
     def get_items(self):
         return sorted(self._items, key=lambda x: x["order"])
 
+    def get_rendered(self, key):
+        """Get previously rendered menu HTML for a render key, or None."""
+        return self._rendered.get(key)
+
+    def set_rendered(self, key, html):
+        """Store rendered menu HTML for a render key and return it."""
+        self._rendered[key] = html
+        return html
+
+    def invalidate(self):
+        """Drop all rendered menus (called whenever the items change)."""
+        self._rendered = {}
+
 
 # Global config instances
 nav_config = NavigationConfig()
 
+
+@receiver(setting_changed)
+def _reset_rendered_menus(*, setting, **kwargs):
+    """Rendered menus depend on URL reversal, so drop them if the URLconf changes."""
+    if setting in ("ROOT_URLCONF", "SITE_NAVIGATION_TYPE"):
+        nav_config.invalidate()
+
 # Example usage:
 if __name__ == "__main__":
     print("=== NavigationRegistry Examples with auth_status ===")
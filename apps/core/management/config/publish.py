@@ -0,0 +1,66 @@
+# config/publish.py
+
+# Models rendered on every full page (navigation, contacts, lists)
+SITE_DEPENDS_ON = (
+    "core.ContactSocialLink core.ContactNumber core.ContactEmail "
+    "core.ContactAddress core.ListCategory core.ListItem"
+)
+
+
+class PublishConfig:
+    """
+    Registry of public routes that are pre-rendered to static HTML by the
+    `prerender` command and regenerated when the models they show change.
+    """
+
+    def __init__(self):
+        self._routes = []
+
+    def register(
+        self,
+        url_name,
+        queryset=None,
+        url_kwargs=None,
+        depends_on="",
+    ):
+        """
+        Register a route for pre-rendering.
+
+        Args:
+            url_name: Django URL name of the route
+            queryset: Callable returning the objects to render one page for
+                (for routes with URL arguments, e.g. article details)
+            url_kwargs: Callable mapping one of those objects to reverse() kwargs
+            depends_on: Space separated 'app_label.ModelName' labels whose
+                changes require re-rendering the route
+        """
+        if (queryset is None) != (url_kwargs is None):
+            raise ValueError(
+                f"Route '{url_name}' needs both queryset and url_kwargs, or neither."
+            )
+
+        self._routes.append(
+            {
+                "url_name": url_name,
+                "queryset": queryset,
+                "url_kwargs": url_kwargs,
+                "depends_on": set(depends_on.split()),
+            }
+        )
+
+    def get_routes(self, url_names=None):
+        """Get registered routes, optionally limited to some URL names."""
+        if not url_names:
+            return list(self._routes)
+        return [route for route in self._routes if route["url_name"] in url_names]
+
+    @staticmethod
+    def get_route_model(route):
+        """Get the model an object route renders one page per instance of."""
+        if route["queryset"] is None:
+            return None
+        return route["queryset"]().model
+
+
+# Global config instance
+publish_config = PublishConfig()
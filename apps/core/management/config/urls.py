@@ -2,7 +2,9 @@
 import logging
 
 from django.core.exceptions import ImproperlyConfigured
-from django.urls import reverse
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf, reverse
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,43 @@ class URLsConfig:
         self._login_redirect_app = None
         self._login_redirect_registered = False
 
+        # Reversed paths keyed by (url name, urlconf, script prefix)
+        self._reversed = {}
+
+    def reverse(self, url_name):
+        """
+        Reverse a URL name, memoised per URLconf and script prefix.
+
+        Failed lookups are memoised as well, so repeated lookups of a missing
+        URL name don't walk the resolver every time.
+
+        Args:
+            url_name (str): The URL name to reverse
+
+        Returns:
+            str: The URL path
+
+        Raises:
+            NoReverseMatch: If the URL name cannot be reversed
+        """
+        key = (url_name, get_urlconf(), get_script_prefix())
+        try:
+            path = self._reversed[key]
+        except KeyError:
+            try:
+                path = reverse(url_name)
+            except NoReverseMatch as e:
+                path = _NoMatch(str(e))
+            self._reversed[key] = path
+
+        if isinstance(path, _NoMatch):
+            raise NoReverseMatch(path.message)
+        return path
+
+    def clear_reversed(self):
+        """Forget all memoised reversed paths."""
+        self._reversed = {}
+
     def register_landing_url(self, url_name, app_name):
         """
         Register a URL name as the landing URL.
@@ -83,7 +122,7 @@ class URLsConfig:
             )
 
         try:
-            return reverse(self._landing_url_name)
+            return self.reverse(self._landing_url_name)
         except Exception as e:
             raise ImproperlyConfigured(
                 f"Could not reverse landing URL '{self._landing_url_name}' "
@@ -107,7 +146,7 @@ class URLsConfig:
             )
 
         try:
-            return reverse(self._login_redirect_url_name)
+            return self.reverse(self._login_redirect_url_name)
         except Exception as e:
             raise ImproperlyConfigured(
                 f"Could not reverse login redirect URL '{self._login_redirect_url_name}' "
@@ -150,17 +189,21 @@ class URLsConfig:
         self._login_redirect_app = None
         self._login_redirect_registered = False
 
+        self.clear_reversed()
+
     def clear_landing(self):
         """Clear only the landing URL registration."""
         self._landing_url_name = None
         self._landing_app = None
         self._landing_registered = False
+        self.clear_reversed()
 
     def clear_login_redirect(self):
         """Clear only the login redirect URL registration."""
         self._login_redirect_url_name = None
         self._login_redirect_app = None
         self._login_redirect_registered = False
+        self.clear_reversed()
 
     def get_login_redirect_url_safe(self):
         """
@@ -181,5 +224,18 @@ class URLsConfig:
                 return "/"
 
 
+class _NoMatch:
+    """Memoised NoReverseMatch, re-raised as a fresh exception on each lookup."""
+
+    def __init__(self, message):
+        self.message = message
+
+
 # Global config instance
 urls_config = URLsConfig()
+
+
+@receiver(setting_changed)
+def _reset_reversed_urls(**kwargs):
+    """Settings overrides (ROOT_URLCONF in tests, etc.) invalidate reversed paths."""
+    urls_config.clear_reversed()
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+
+from django.core.cache import cache
+
+from ..models.contact import (
+    ContactAddress,
+    ContactEmail,
+    ContactNumber,
+    ContactSocialLink,
+)
+from .cache import bump_version, get_version, versioned_key
+from .replica import replica_reads
+
+CONTACTS_NAMESPACE = "contacts"
+
+
+@dataclass(frozen=True)
+class ContactSnapshot:
+    """
+    Immutable view of all active site contact data.
+
+    Built once per contacts version and shared between requests, so the
+    tuples and model instances it holds must be treated as read-only.
+    """
+
+    social_links: tuple = ()
+    phone_numbers: tuple = ()
+    email_addresses: tuple = ()
+    physical_addresses: tuple = ()
+    primary_phone: ContactNumber | None = None
+    whatsapp_phone: ContactNumber | None = None
+    primary_email: ContactEmail | None = None
+    contact_form_address: ContactAddress | None = None
+
+    def as_dict(self):
+        """Return the snapshot in the shape of the `get_contact_info` tag."""
+        return {
+            "social_links": self.social_links,
+            "phone_numbers": self.phone_numbers,
+            "email_addresses": self.email_addresses,
+            "physical_addresses": self.physical_addresses,
+            "primary_phone": self.primary_phone,
+            "whatsapp_phone": self.whatsapp_phone,
+            "primary_email": self.primary_email,
+            "contact_form_address": self.contact_form_address,
+        }
+
+
+# (version, snapshot) of the last snapshot seen by this process
+_local_snapshot = (None, None)
+
+
+def load_contact_snapshot():
+    """Query all active contact models and build a fresh snapshot."""
+    with replica_reads():
+        social_links = tuple(ContactSocialLink.objects.filter(is_active=True))
+        phone_numbers = tuple(ContactNumber.objects.filter(is_active=True))
+        email_addresses = tuple(ContactEmail.objects.filter(is_active=True))
+        physical_addresses = tuple(ContactAddress.objects.filter(is_active=True))
+
+    return ContactSnapshot(
+        social_links=social_links,
+        phone_numbers=phone_numbers,
+        email_addresses=email_addresses,
+        physical_addresses=physical_addresses,
+        primary_phone=next((n for n in phone_numbers if n.is_primary), None),
+        whatsapp_phone=next((n for n in phone_numbers if n.use_for_whatsapp), None),
+        primary_email=next((e for e in email_addresses if e.is_primary), None),
+        contact_form_address=next(
+            (a for a in physical_addresses if a.use_in_contact_form), None
+        ),
+    )
+
+
+def get_contact_snapshot():
+    """
+    Get the contact snapshot for the current contacts version.
+
+    Looks in this process first, then in the shared cache, and only queries
+    the database when the version has been bumped since the last load.
+    """
+    global _local_snapshot
+
+    version = get_version(CONTACTS_NAMESPACE)
+    local_version, snapshot = _local_snapshot
+    if local_version == version:
+        return snapshot
+
+    key = versioned_key(CONTACTS_NAMESPACE, "snapshot")
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = load_contact_snapshot()
+        cache.set(key, snapshot)
+
+    _local_snapshot = (version, snapshot)
+    return snapshot
+
+
+def invalidate_contact_snapshot():
+    """Bump the contacts version so every process reloads its snapshot."""
+    bump_version(CONTACTS_NAMESPACE)
@@ -0,0 +1,47 @@
+import os
+import tempfile
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.filebased import FileBasedCache as BaseFileBasedCache
+from django.core.files import locks
+
+
+class FileBasedCache(BaseFileBasedCache):
+    """
+    Django's file-based cache with an atomic `add()` and `incr()`, so it can
+    hold refresh locks and counters shared by the workers of a host.
+
+    Django's own `add()` checks for the key and then writes it, so two
+    processes can both add the same key. Here the value is written to a
+    temporary file and hard-linked to the key's file, which fails if the
+    file exists. `incr()` holds an exclusive lock on a file next to the
+    key's while it reads and writes the value.
+    """
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        # Also removes the file of an expired entry, so it can be replaced
+        if self.has_key(key, version):
+            return False
+        self._createdir()
+        fname = self._key_to_file(key, version)
+        self._cull()
+        fd, tmp_path = tempfile.mkstemp(dir=self._dir)
+        try:
+            with open(fd, "wb") as f:
+                self._write_content(f, timeout, value)
+            try:
+                os.link(tmp_path, fname)
+            except FileExistsError:
+                return False
+            return True
+        finally:
+            os.remove(tmp_path)
+
+    def incr(self, key, delta=1, version=None):
+        self._createdir()
+        with open(f"{self._key_to_file(key, version)}.lock", "ab") as lock_file:
+            locks.lock(lock_file, locks.LOCK_EX)
+            try:
+                return super().incr(key, delta, version)
+            finally:
+                locks.unlock(lock_file)
@@ -0,0 +1,55 @@
+from django.core.cache import cache
+
+from ..models.list import ListItem
+from .cache import bump_version, get_version, versioned_key
+from .replica import replica_reads
+
+LISTS_NAMESPACE = "lists"
+
+# Categories rendered by the list template tags
+LIST_CATEGORIES = ("Features", "FAQ")
+
+# (version, lists) of the last lists seen by this process
+_local_lists = (None, None)
+
+
+def load_lists():
+    """
+    Fetch the items of every category in LIST_CATEGORIES with a single
+    query and group them by category name, keeping the model ordering.
+    """
+    lists = {name: [] for name in LIST_CATEGORIES}
+    items = ListItem.objects.filter(category__name__in=LIST_CATEGORIES).select_related(
+        "category"
+    )
+    with replica_reads():
+        for item in items:
+            lists[item.category.name].append(item)
+    return {name: tuple(items) for name, items in lists.items()}
+
+
+def get_list(category_name):
+    """
+    Get the cached items of a list category as a tuple.
+
+    Looks in this process first, then in the shared cache, and only queries
+    the database when the lists version has been bumped since the last load.
+    """
+    global _local_lists
+
+    version = get_version(LISTS_NAMESPACE)
+    local_version, lists = _local_lists
+    if local_version != version:
+        key = versioned_key(LISTS_NAMESPACE, "items")
+        lists = cache.get(key)
+        if lists is None:
+            lists = load_lists()
+            cache.set(key, lists)
+        _local_lists = (version, lists)
+
+    return lists.get(category_name, ())
+
+
+def invalidate_lists():
+    """Bump the lists version so every process reloads its lists."""
+    bump_version(LISTS_NAMESPACE)
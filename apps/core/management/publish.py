@@ -0,0 +1,162 @@
+import logging
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connection
+from django.urls import reverse
+
+from .compress import write_atomic, write_compressed_variants
+from .config.publish import publish_config
+
+logger = logging.getLogger(__name__)
+
+PUBLISH_INDEX = "index.html"
+
+# Single worker: regenerations are serialized, so two saves never race on a file
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_publish_root():
+    return Path(settings.PUBLISH_ROOT)
+
+
+def get_publish_file(path):
+    """
+    Map a URL path to its file under PUBLISH_ROOT, e.g. '/' -> 'index.html'
+    and '/blog/3/' -> 'blog/3/index.html', matching an nginx
+    `try_files /publish$uri/index.html` rule.
+    """
+    relative = path.strip("/")
+    return get_publish_root() / relative / PUBLISH_INDEX
+
+
+def get_route_pages(route):
+    """Get the URL paths a registered route renders to."""
+    if route["queryset"] is None:
+        return [reverse(route["url_name"])]
+    return [
+        reverse(route["url_name"], kwargs=route["url_kwargs"](obj))
+        for obj in route["queryset"]()
+    ]
+
+
+def get_client():
+    """A test client that renders pages as an anonymous visitor of SITE_URL."""
+    from django.test import Client
+
+    site = urlsplit(settings.SITE_URL)
+    return Client(
+        raise_request_exception=True,
+        HTTP_HOST=site.netloc or "localhost",
+    ), site.scheme == "https"
+
+
+def render_page(path, client=None, secure=None):
+    """
+    Render a URL path through the full middleware stack.
+
+    Returns:
+        bytes | None: The page content, or None if it didn't render with 200 OK
+    """
+    if client is None:
+        client, secure = get_client()
+
+    response = client.get(path, secure=secure)
+    if response.status_code != 200:
+        logger.warning(f"Not publishing '{path}': status {response.status_code}")
+        return None
+    return response.content
+
+
+def publish_page(path, client=None, secure=None, compress=True):
+    """
+    Render a page and write it (and its precompressed variants) to
+    PUBLISH_ROOT. A page that no longer renders is unpublished.
+
+    Returns:
+        Path | None: The written file
+    """
+    content = render_page(path, client, secure)
+    if content is None:
+        unpublish_page(path)
+        return None
+
+    target = get_publish_file(path)
+    write_atomic(target, content)
+    if compress:
+        write_compressed_variants(target, content)
+    return target
+
+
+def unpublish_page(path):
+    """Remove a published page and its precompressed variants."""
+    target = get_publish_file(path)
+    for file in (target, *target.parent.glob(f"{PUBLISH_INDEX}.*")):
+        file.unlink(missing_ok=True)
+
+
+def clear_published():
+    """Remove every published page."""
+    shutil.rmtree(get_publish_root(), ignore_errors=True)
+
+
+def get_changed_pages(instance):
+    """
+    Work out which pages a saved or deleted instance affects.
+
+    Returns:
+        tuple: (routes, object_pages) where routes are URL names to render
+            in full and object_pages are (url_name, pk, path) of the pages
+            rendered for this very instance.
+    """
+    model = type(instance)
+    routes = set()
+    object_pages = []
+    for route in publish_config.get_routes():
+        if publish_config.get_route_model(route) is model:
+            path = reverse(route["url_name"], kwargs=route["url_kwargs"](instance))
+            object_pages.append((route["url_name"], instance.pk, path))
+        if model._meta.label in route["depends_on"]:
+            routes.add(route["url_name"])
+    return routes, object_pages
+
+
+def publish_changes(routes, object_pages):
+    """
+    Regenerate the pages affected by a change. Object pages whose instance is
+    gone or no longer in the route's queryset are unpublished.
+    """
+    client, secure = get_client()
+    try:
+        for route in publish_config.get_routes(routes) if routes else ():
+            for path in get_route_pages(route):
+                publish_page(path, client, secure)
+
+        for url_name, pk, path in object_pages:
+            (route,) = publish_config.get_routes([url_name])
+            if not route["queryset"]().filter(pk=pk).exists():
+                unpublish_page(path)
+            elif url_name not in routes:
+                publish_page(path, client, secure)
+    except Exception as e:
+        logger.error(f"Error publishing pages: {e}")
+    finally:
+        # Worker threads keep their own connection; don't leave it open
+        connection.close()
+
+
+def schedule_publish(routes, object_pages):
+    """Regenerate pages in the background publishing thread."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="publish"
+            )
+    return _executor.submit(publish_changes, routes, object_pages)
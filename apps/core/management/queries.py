@@ -0,0 +1,100 @@
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_in_list_re = re.compile(r"\bIN \((?:%s, )*%s\)")
+
+# Set inside `record_queries()`. A context variable rather than a wrapper on
+# the current connections, so the queries async views run in other threads
+# (with their own connections) are recorded too.
+_recorder = ContextVar("query_recorder", default=None)
+
+
+def get_shape(sql):
+    """
+    Reduce a query to its shape. Django already sends the values as
+    parameters, so only the length of IN lists has to be evened out.
+    """
+    return _in_list_re.sub("IN (...)", sql)
+
+
+class QueryRecorder:
+    """
+    Count the queries made inside `record_queries()`, their total time and
+    how often each SQL statement repeats. Only counters are updated per
+    query; shapes are worked out when reporting. Under ASGI the queries of
+    one request can run in several threads at once, so the counters are
+    updated under a lock.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.duration += elapsed
+                self.count += 1
+                self.statements[sql] += 1
+
+    def get_repeated(self, threshold):
+        """
+        Query shapes run at least `threshold` times, most repeated first:
+        the likely N+1 queries.
+
+        Returns:
+            list: (shape, count) tuples
+        """
+        shapes = Counter()
+        for sql, count in self.statements.items():
+            shapes[get_shape(sql)] += count
+        return [
+            (shape, count)
+            for shape, count in shapes.most_common()
+            if count >= threshold
+        ]
+
+
+def record_execute(execute, sql, params, many, context):
+    """Execute wrapper passing queries to the active recorder, if any."""
+    recorder = _recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_recorder(connection):
+    """Let `record_queries()` see the queries of a database connection."""
+    if record_execute not in connection.execute_wrappers:
+        # First, so the `execute_wrapper()` blocks open at the time, which
+        # pop the last wrapper when they exit, leave it in place
+        connection.execute_wrappers.insert(0, record_execute)
+
+
+@contextmanager
+def record_queries():
+    """
+    Record the queries made on every database inside the block, including
+    those run in threads by `sync_to_async`.
+
+    Usage:
+        with record_queries() as recorder:
+            list(Category.objects.all())
+        print(recorder.count, recorder.duration)
+    """
+    recorder = QueryRecorder()
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
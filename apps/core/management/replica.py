@@ -0,0 +1,121 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+from .cache import get_bump_time, model_namespace
+
+REPLICA_ALIAS = "replica"
+
+# Set inside views and loaders whose reads may go to the replica
+_replica_reads = ContextVar("replica_reads", default=False)
+
+# Set by ReplicaMiddleware for the duration of a request. Mutable, so a write
+# made in a thread the request runs in (e.g. a sync view under ASGI) pins the
+# rest of the request too.
+_request_state = ContextVar("replica_request_state", default=None)
+
+
+@dataclass
+class RequestState:
+    # Whether reads have to stay on the primary for the rest of the request
+    pinned: bool = False
+    # model -> whether its last change is old enough to read from the replica
+    settled: dict = field(default_factory=dict)
+
+
+def replica_configured():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+@contextmanager
+def replica_reads():
+    """
+    Let the reads made inside the block go to the replica. Works as a
+    decorator too. Reads still go to the primary once the request has
+    written, and for models changed in the last DB_REPLICA_LAG seconds.
+
+    Usage:
+        with replica_reads():
+            items = list(Item.objects.filter(is_active=True))
+    """
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def request_state(pinned=False):
+    """Track writes for the duration of a request (see ReplicaMiddleware)."""
+    outer = _request_state.get()
+    # Nested requests (e.g. publishing through the test client) keep the pin
+    state = RequestState(pinned=pinned or bool(outer and outer.pinned))
+    token = _request_state.set(state)
+    try:
+        yield state
+    finally:
+        _request_state.reset(token)
+
+
+def pin_to_primary():
+    """Send every read of the current request to the primary from now on."""
+    state = _request_state.get()
+    if state is not None:
+        state.pinned = True
+
+
+def is_settled(model, state=None):
+    """
+    Check that a model hasn't changed in the last DB_REPLICA_LAG seconds, so
+    the replica has it. Saves and deletes bump the model's generation (see
+    signals/generations.py), which records when it happened.
+    """
+    if state is not None and model in state.settled:
+        return state.settled[model]
+    bumped = get_bump_time(model_namespace(model))
+    settled = time.time() - bumped >= settings.DB_REPLICA_LAG
+    if state is not None:
+        state.settled[model] = settled
+    return settled
+
+
+class ReplicaRouter:
+    """
+    Send reads made inside `replica_reads()` to the replica database, and
+    everything else to the default one.
+
+    - Writes always go to the primary, and pin the rest of the request to it
+      (read-your-writes). ReplicaMiddleware carries the pin over to the
+      same client's next requests for DB_REPLICA_LAG seconds.
+    - Models changed in the last DB_REPLICA_LAG seconds are read from the
+      primary, so caches keyed by model generations are never filled with
+      rows the replica hasn't caught up on yet.
+    - Migrations only run on the primary; the replica is a copy of it.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _replica_reads.get() or not replica_configured():
+            return DEFAULT_DB_ALIAS
+        state = _request_state.get()
+        if state is not None and state.pinned:
+            return DEFAULT_DB_ALIAS
+        if not is_settled(model, state):
+            return DEFAULT_DB_ALIAS
+        return REPLICA_ALIAS
+
+    def db_for_write(self, model, **hints):
+        pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both databases hold the same rows
+        databases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS}
+        return obj1._state.db in databases and obj2._state.db in databases
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db != REPLICA_ALIAS
@@ -0,0 +1,260 @@
+import hashlib
+import json
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+
+from .compress import write_atomic
+
+logger = logging.getLogger(__name__)
+
+GRAPH_FILE = "graph.json"
+GRAPH_VERSION = 1
+
+SASS_EXTENSIONS = (".scss", ".sass")
+
+_comment_re = re.compile(r"/\*.*?\*/|^\s*//.*?$", re.DOTALL | re.MULTILINE)
+_import_re = re.compile(r"@(?:import|use|forward)\s+([^;]+);")
+_quoted_re = re.compile(r"""["']([^"']+)["']""")
+
+
+def get_cache_dir():
+    return Path(settings.SASS_CACHE_DIR)
+
+
+def get_include_paths():
+    """Include paths passed to libsass, in the same order as django-sass-processor."""
+    from sass_processor.apps import APPS_INCLUDE_DIRS
+
+    include_dirs = getattr(settings, "SASS_PROCESSOR_INCLUDE_DIRS", [])
+    return [str(path) for path in include_dirs] + list(APPS_INCLUDE_DIRS)
+
+
+def get_compile_options():
+    """libsass options that change the output, part of every entry's cache state."""
+    try:
+        precision = int(settings.SASS_PRECISION)
+    except (AttributeError, TypeError, ValueError):
+        precision = None
+    output_style = getattr(
+        settings, "SASS_OUTPUT_STYLE", "nested" if settings.DEBUG else "compressed"
+    )
+    return {"precision": precision, "output_style": output_style}
+
+
+def file_digest(path):
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+def file_state(path):
+    """(mtime_ns, size, sha1) of a file, as stored in the dependency graph."""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size, file_digest(path)]
+
+
+def parse_imports(path):
+    """Get the targets of every @import/@use/@forward in a SCSS file."""
+    source = _comment_re.sub("", Path(path).read_text(encoding="utf-8"))
+    targets = []
+    for statement in _import_re.findall(source):
+        for target in _quoted_re.findall(statement):
+            if target.startswith(("sass:", "http:", "https:", "//")) or (
+                target.endswith(".css") or "url(" in statement
+            ):
+                continue
+            targets.append(target)
+    return targets
+
+
+def resolve_import(target, base_dir, include_paths):
+    """
+    Resolve an import target the way libsass does: relative to the importing
+    file, then to each include path, trying partials and index files.
+    """
+    target_path = Path(target)
+    if target_path.suffix in SASS_EXTENSIONS:
+        names = [target_path.name, f"_{target_path.name}"]
+    else:
+        names = [
+            f"{prefix}{target_path.name}{ext}"
+            for ext in (*SASS_EXTENSIONS, ".css")
+            for prefix in ("", "_")
+        ] + [
+            f"{target_path.name}/{prefix}index{ext}"
+            for ext in SASS_EXTENSIONS
+            for prefix in ("_", "")
+        ]
+
+    for directory in (base_dir, *include_paths):
+        for name in names:
+            candidate = Path(directory) / target_path.parent / name
+            if candidate.is_file():
+                return str(candidate.resolve())
+    return None
+
+
+def find_dependencies(entry, include_paths):
+    """Get the entry and every file it imports, directly or transitively."""
+    entry = str(Path(entry).resolve())
+    seen = {entry}
+    pending = [entry]
+    while pending:
+        path = pending.pop()
+        if not path.endswith(SASS_EXTENSIONS):
+            continue
+        for target in parse_imports(path):
+            resolved = resolve_import(target, Path(path).parent, include_paths)
+            if resolved is None:
+                logger.warning(f"Unresolved import '{target}' in {path}")
+            elif resolved not in seen:
+                seen.add(resolved)
+                pending.append(resolved)
+    return sorted(seen)
+
+
+def compile_entry(entry):
+    """
+    Compile one SCSS entry to CSS. Runs in a worker process, so it sets
+    Django up itself when the process was spawned rather than forked.
+    """
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+    import sass
+    from sass_processor.utils import get_custom_functions
+
+    options = get_compile_options()
+    compile_kwargs = {
+        "filename": entry,
+        "include_paths": get_include_paths(),
+        "custom_functions": get_custom_functions(),
+    }
+    if options["precision"]:
+        compile_kwargs["precision"] = options["precision"]
+    if options["output_style"]:
+        compile_kwargs["output_style"] = options["output_style"]
+    return sass.compile(**compile_kwargs)
+
+
+class SassBuildCache:
+    """
+    Dependency graph of every SCSS entry, with the state of each input file
+    and a copy of the compiled CSS, stored under SASS_CACHE_DIR.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir or get_cache_dir())
+        self.graph_path = self.cache_dir / GRAPH_FILE
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        try:
+            graph = json.loads(self.graph_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return
+        if graph.get("version") == GRAPH_VERSION:
+            self.entries = graph.get("entries", {})
+
+    def save(self):
+        graph = {"version": GRAPH_VERSION, "entries": self.entries}
+        write_atomic(self.graph_path, json.dumps(graph, indent=2).encode())
+
+    def css_path(self, entry):
+        return self.cache_dir / f"{hashlib.sha1(entry.encode()).hexdigest()}.css"
+
+    def is_fresh(self, entry, options):
+        """
+        Check that an entry's options and inputs are unchanged since its last
+        compile. Inputs are compared by mtime and size first, and only hashed
+        when those differ, so an unchanged tree is checked without reading it.
+        """
+        cached = self.entries.get(entry)
+        if not cached or cached["options"] != options:
+            return False
+        if not self.css_path(entry).is_file():
+            return False
+
+        for path, (mtime_ns, size, digest) in cached["deps"].items():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                return False
+            if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+                continue
+            if file_digest(path) != digest:
+                return False
+            cached["deps"][path] = [stat.st_mtime_ns, stat.st_size, digest]
+        return True
+
+    def get_css(self, entry):
+        return self.css_path(entry).read_bytes()
+
+    def update(self, entry, options, css, include_paths):
+        """Store a freshly compiled entry and the current state of its inputs."""
+        write_atomic(self.css_path(entry), css)
+        self.entries[entry] = {
+            "options": options,
+            "deps": {
+                path: file_state(path)
+                for path in find_dependencies(entry, include_paths)
+            },
+        }
+
+
+def get_output_path(entry):
+    """Compiled CSS is written next to its source, like `compilescss` does."""
+    return Path(entry).with_suffix(".css")
+
+
+def build_entries(entries, workers=None, force=False):
+    """
+    Compile SCSS entries whose inputs changed since the last build, in
+    parallel, and restore the cached CSS of the others.
+
+    Args:
+        entries (list[str]): Absolute paths of the SCSS entries
+        workers (int | None): Worker processes, defaults to the CPU count
+        force (bool): Recompile every entry
+
+    Returns:
+        tuple: (compiled, cached) lists of entries
+    """
+    build_cache = SassBuildCache()
+    options = get_compile_options()
+    include_paths = get_include_paths()
+
+    entries = [str(Path(entry).resolve()) for entry in entries]
+    stale = [
+        entry
+        for entry in entries
+        if force or not build_cache.is_fresh(entry, options)
+    ]
+    fresh = [entry for entry in entries if entry not in stale]
+
+    if len(stale) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(compile_entry, stale))
+    else:
+        results = [compile_entry(entry) for entry in stale]
+
+    for entry, css in zip(stale, results):
+        css = css.encode()
+        build_cache.update(entry, options, css, include_paths)
+        write_atomic(get_output_path(entry), css)
+
+    for entry in fresh:
+        css = build_cache.get_css(entry)
+        output = get_output_path(entry)
+        if not output.is_file() or output.read_bytes() != css:
+            write_atomic(output, css)
+
+    build_cache.save()
+    return stale, fresh
@@ -0,0 +1,54 @@
+import logging
+import re
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# PRAGMA values are interpolated into SQL: only allow keywords and integers
+_value_re = re.compile(r"^(-?\d+|[A-Za-z_]+)$")
+
+
+# Integer values SQLite reports for PRAGMAs set by keyword
+PRAGMA_KEYWORDS = {
+    "synchronous": {0: "off", 1: "normal", 2: "full", 3: "extra"},
+    "temp_store": {0: "default", 1: "file", 2: "memory"},
+}
+
+
+def get_pragmas():
+    """The PRAGMAs from SQLITE_PRAGMAS, skipping invalid values."""
+    pragmas = {}
+    for name, value in getattr(settings, "SQLITE_PRAGMAS", {}).items():
+        if value is None or value == "":
+            continue
+        if not name.isidentifier() or not _value_re.match(str(value)):
+            logger.warning(f"Ignoring invalid SQLite PRAGMA {name}={value!r}")
+            continue
+        pragmas[name] = value
+    return pragmas
+
+
+def apply_pragmas(connection):
+    """Set the configured PRAGMAs on a new SQLite connection."""
+    # On the sqlite3 connection itself: connection setup isn't counted as the
+    # queries of the request that opened it (see record_queries())
+    for name, value in get_pragmas().items():
+        connection.connection.execute(f"PRAGMA {name} = {value}")
+
+
+def read_pragmas(connection, names=None):
+    """
+    Read the active value of PRAGMAs from a connection.
+
+    Returns:
+        dict: {name: value}
+    """
+    active = {}
+    with connection.cursor() as cursor:
+        for name in names or get_pragmas():
+            cursor.execute(f"PRAGMA {name}")
+            row = cursor.fetchone()
+            value = row[0] if row else None
+            active[name] = PRAGMA_KEYWORDS.get(name, {}).get(value, value)
+    return active
@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+from .compress import write_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class HashedStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage that writes content-hashed copies of every static file
+    (e.g. `init.3f2a9c1b.css`) and a `staticfiles.json` manifest, so assets
+    can be cached by clients forever.
+
+    Vendored npm packages ship CSS that references files they don't include
+    (docs images, source maps). Those references are left unhashed with a
+    warning instead of failing the whole collectstatic run.
+
+    Before `buildstatic` has written the manifest (tests, a fresh checkout),
+    {% static %} hashes collected files on the fly and leaves the others
+    unhashed, with a warning, instead of raising for every file.
+    """
+
+    manifest_strict = False
+
+    def load_manifest(self):
+        hashed_files, manifest_hash = super().load_manifest()
+        if not hashed_files:
+            logger.warning(
+                f"No static files manifest in {self.location}: static URLs "
+                "aren't hashed until `manage.py buildstatic` runs"
+            )
+        return hashed_files, manifest_hash
+
+    def hashed_name(self, name, content=None, filename=None):
+        try:
+            return super().hashed_name(name, content, filename)
+        except ValueError:
+            if content is not None:
+                raise
+            logger.warning(f"Static file '{name}' not found, leaving it unhashed")
+            return name
+
+
+class ParallelManifestStaticFilesStorage(HashedStaticFilesStorage):
+    """
+    HashedStaticFilesStorage that copies and hashes files in a thread pool.
+
+    - Files saved from a local path (collectstatic copies and the hashed
+      copies made during post-processing) are copied in the pool; every
+      pending copy is awaited before post-processing and before the manifest
+      is written.
+    - Hashes of original files are computed in the pool up front, and reused
+      from the previous manifest when a file's mtime and size are unchanged.
+    - The manifest is written to a temporary file and moved into place, so a
+      failed build never leaves a truncated staticfiles.json behind.
+    """
+
+    def __init__(self, *args, max_workers=None, **kwargs):
+        self.max_workers = max_workers
+        self._executor = None
+        self._copies = []
+        self._hashes = {}
+        self.file_stats = {}
+        super().__init__(*args, **kwargs)
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="collectstatic"
+            )
+        return self._executor
+
+    def _copy(self, source, full_path):
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        tmp_path = f"{full_path}.{threading.get_ident()}.tmp"
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, full_path)
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
+
+    def _save(self, name, content):
+        source = getattr(content, "name", None)
+        if not (isinstance(source, str) and os.path.isabs(source)):
+            return super()._save(name, content)
+        if not os.path.isfile(source):
+            return super()._save(name, content)
+
+        self._copies.append(
+            self._get_executor().submit(self._copy, source, self.path(name))
+        )
+        return name.replace("\\", "/")
+
+    def wait_for_copies(self):
+        """Block until every pending copy is written, raising the first error."""
+        copies, self._copies = self._copies, []
+        for future in copies:
+            future.result()
+
+    def load_file_stats(self):
+        """(mtime_ns, size, hash) per file, as recorded by the previous build."""
+        content = self.read_manifest()
+        if content is None:
+            return {}
+        try:
+            return json.loads(content).get("stats", {})
+        except json.JSONDecodeError:
+            return {}
+
+    def _hash_original(self, name, previous):
+        stat = os.stat(self.path(name))
+        if previous and previous[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return name, previous
+        with self.open(name) as content:
+            file_hash = super().file_hash(name, content)
+        return name, [stat.st_mtime_ns, stat.st_size, file_hash]
+
+    def hash_originals(self, names):
+        """Hash the collected originals in the pool, reusing unchanged hashes."""
+        previous = self.load_file_stats()
+        jobs = [
+            self._get_executor().submit(self._hash_original, name, previous.get(name))
+            for name in names
+            if self.exists(name)
+        ]
+        self.file_stats = dict(job.result() for job in jobs)
+        self._hashes = {name: stats[2] for name, stats in self.file_stats.items()}
+
+    def file_hash(self, name, content=None):
+        # Processed CSS/JS is passed as a ContentFile and always hashed anew
+        if name in self._hashes and not isinstance(content, ContentFile):
+            return self._hashes[name]
+        return super().file_hash(name, content)
+
+    def post_process(self, paths, dry_run=False, **options):
+        self.wait_for_copies()
+        if not dry_run:
+            self.hash_originals(paths)
+        try:
+            yield from super().post_process(paths, dry_run=dry_run, **options)
+        finally:
+            self.wait_for_copies()
+            self._hashes = {}
+
+    def save_manifest(self):
+        self.wait_for_copies()
+        self.manifest_hash = self.file_hash(
+            None, ContentFile(json.dumps(sorted(self.hashed_files.items())).encode())
+        )
+        payload = {
+            "paths": self.hashed_files,
+            "version": self.manifest_version,
+            "hash": self.manifest_hash,
+            "stats": self.file_stats,
+        }
+        write_atomic(
+            self.manifest_storage.path(self.manifest_name),
+            json.dumps(payload).encode(),
+        )
@@ -0,0 +1,179 @@
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.template import Template, TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.template.loader_tags import ExtendsNode, IncludeNode
+from django.template.loaders.cached import Loader as CachedLoader
+from django.template.utils import get_app_template_dirs
+
+APPS_DIR = Path(settings.BASE_DIR) / "apps"
+
+# Parses per template: the fastest one is reported, so the first parse
+# importing the {% load %}ed tag libraries doesn't skew the numbers
+PARSE_REPEAT = 3
+
+
+# The literal depends_on of a {% cached_fragment %} tag
+_fragment_depends_on_re = re.compile(
+    r"{%\s*cached_fragment\b[^%]*?\bdepends_on=(['\"])(.*?)\1"
+)
+
+
+def iter_project_templates():
+    """Yield (template dir, path) for the template files under apps/*/templates."""
+    for template_dir in get_app_template_dirs("templates"):
+        template_dir = Path(template_dir)
+        if not template_dir.is_relative_to(APPS_DIR):
+            continue
+        for path in template_dir.rglob("*"):
+            if path.is_file():
+                yield template_dir, path
+
+
+def get_project_template_names():
+    """Names of the templates under apps/*/templates, relative to their dir."""
+    return sorted(
+        {
+            path.relative_to(template_dir).as_posix()
+            for template_dir, path in iter_project_templates()
+        }
+    )
+
+
+def get_fragment_dependencies():
+    """
+    The literal depends_on labels of the {% cached_fragment %} tags in the
+    project's templates. Tags taking them from the context aren't found:
+    track their models with `track_models()` in an app's ready().
+    """
+    found = set()
+    for _, path in iter_project_templates():
+        try:
+            source = path.read_text()
+        except (OSError, UnicodeDecodeError):
+            continue
+        found.update(m.group(2) for m in _fragment_depends_on_re.finditer(source))
+    return sorted(found)
+
+
+def get_engine():
+    return engines["django"].engine
+
+
+def uses_cached_loader(engine=None):
+    engine = engine or get_engine()
+    return any(isinstance(loader, CachedLoader) for loader in engine.template_loaders)
+
+
+def find_source(engine, name):
+    """Find a template's source with the engine's loaders, bypassing caches."""
+    for loader in engine.template_loaders:
+        for source_loader in getattr(loader, "loaders", [loader]):
+            for origin in source_loader.get_template_sources(name):
+                try:
+                    return origin, source_loader.get_contents(origin)
+                except TemplateDoesNotExist:
+                    continue
+    raise TemplateDoesNotExist(name)
+
+
+def get_dependencies(template):
+    """Names of the templates a template extends or includes by a literal name."""
+    names = []
+    for node in template.nodelist.get_nodes_by_type((ExtendsNode, IncludeNode)):
+        expression = node.parent_name if isinstance(node, ExtendsNode) else node.template
+        # Names taken from the context are only known when rendering
+        if not getattr(expression, "is_var", True) and not expression.filters:
+            names.append(str(expression.var))
+    return list(dict.fromkeys(names))
+
+
+def compile_template(name):
+    """
+    Parse a template from its source, without the cached loader.
+
+    Returns:
+        dict: name, origin, size (bytes), parse time (seconds), the names it
+            extends or includes, and the error if it doesn't compile
+    """
+    engine = get_engine()
+    result = {
+        "name": name,
+        "origin": None,
+        "size": 0,
+        "parse_time": 0.0,
+        "dependencies": [],
+        "error": None,
+    }
+    try:
+        origin, source = find_source(engine, name)
+        result["origin"] = origin.name
+        result["size"] = len(source.encode())
+        parse_times = []
+        for _ in range(PARSE_REPEAT):
+            start = time.perf_counter()
+            template = Template(source, origin, name, engine)
+            parse_times.append(time.perf_counter() - start)
+        result["parse_time"] = min(parse_times)
+        result["dependencies"] = get_dependencies(template)
+    except TemplateDoesNotExist:
+        result["error"] = "Template not found"
+    except TemplateSyntaxError as e:
+        result["error"] = str(e)
+    return result
+
+
+def compile_templates(names, workers=None):
+    """
+    Compile templates in parallel, along with the templates they extend or
+    include.
+
+    Args:
+        names (list[str]): Template names
+        workers (int | None): Worker processes, defaults to the CPU count
+
+    Returns:
+        dict: name -> the result of `compile_template()`
+    """
+    results = {}
+    pending = list(dict.fromkeys(names))
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+        while pending:
+            for result in executor.map(compile_template, pending):
+                results[result["name"]] = result
+            pending = list(
+                dict.fromkeys(
+                    dependency
+                    for name in pending
+                    for dependency in results[name]["dependencies"]
+                    if dependency not in results
+                )
+            )
+    return results
+
+
+def get_tree(name, results):
+    """
+    Totals over a template and everything it extends or includes, counting
+    each template once.
+
+    Returns:
+        dict: templates (count), size (bytes), parse_time (seconds)
+    """
+    seen = set()
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in seen or current not in results:
+            continue
+        seen.add(current)
+        pending.extend(results[current]["dependencies"])
+    return {
+        "templates": len(seen),
+        "size": sum(results[n]["size"] for n in seen),
+        "parse_time": sum(results[n]["parse_time"] for n in seen),
+    }
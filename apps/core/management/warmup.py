@@ -0,0 +1,130 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.db import connections
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.urls import NoReverseMatch, URLResolver, get_resolver, resolve, reverse
+
+from .cache_backends import uncounted
+from .templates import get_project_template_names, uses_cached_loader
+
+
+def iter_url_names(resolver=None, namespace=""):
+    """Yield every named URL, qualified with its namespaces."""
+    resolver = resolver or get_resolver()
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            prefix = f"{namespace}{pattern.namespace}:" if pattern.namespace else namespace
+            yield from iter_url_names(pattern, prefix)
+        elif pattern.name:
+            yield namespace + pattern.name
+
+
+def warm_templates():
+    """
+    Compile the project's templates into the cached loaders of the template
+    engines, so no request pays for reading and parsing them.
+    """
+    if not uses_cached_loader():
+        return "skipped, the template loaders aren't cached"
+
+    names = get_project_template_names()
+    compiled = failed = 0
+    for engine in engines.all():
+        for name in names:
+            try:
+                engine.get_template(name)
+            except TemplateDoesNotExist:
+                continue
+            except TemplateSyntaxError:
+                # Broken templates fail on their first request all the same:
+                # `manage.py check_templates` lists them
+                failed += 1
+            else:
+                compiled += 1
+    detail = f"{compiled} compiled"
+    return f"{detail}, {failed} failed" if failed else detail
+
+
+def warm_urls():
+    """
+    Populate the URL resolvers (and import the views behind them) by
+    reversing and resolving every named URL that takes no arguments.
+    """
+    resolved = with_args = 0
+    for name in iter_url_names():
+        try:
+            path = reverse(name)
+        except NoReverseMatch:
+            # Needs arguments: reversing it once still populated its resolver
+            with_args += 1
+            continue
+        resolve(path)
+        resolved += 1
+    return f"{resolved} resolved, {with_args} take arguments"
+
+
+def warm_navigation():
+    """Render the navigation menu for anonymous and signed-in visitors."""
+    from django.test import RequestFactory
+
+    from ..templatetags.navigation import navmenu
+
+    request = RequestFactory().get("/")
+    for user in (AnonymousUser(), get_user_model()()):
+        request.user = user
+        navmenu({"request": request})
+    return "2 menus rendered"
+
+
+def warm_connections():
+    """Open a connection to every database."""
+    for connection in connections.all():
+        connection.ensure_connection()
+    return f"{len(connections.all())} opened"
+
+
+def warm_caches():
+    """Load the contact snapshot (with the primary email) and lists into the caches."""
+    from .contacts import get_contact_snapshot
+    from .lists import LIST_CATEGORIES, get_list
+
+    get_contact_snapshot()
+    for category_name in LIST_CATEGORIES:
+        get_list(category_name)
+    return "contacts and lists loaded"
+
+
+# Phases that only fill this process's memory, and so can run in the
+# gunicorn master before the workers are forked
+LOCAL_PHASES = {
+    "templates": warm_templates,
+    "urls": warm_urls,
+    "navigation": warm_navigation,
+}
+
+# Phases that open connections, and so have to run in each worker
+WORKER_PHASES = {
+    "connections": warm_connections,
+    "caches": warm_caches,
+}
+
+PHASES = {**LOCAL_PHASES, **WORKER_PHASES}
+
+
+def warmup(phases=None):
+    """
+    Run warmup phases (all by default) and yield (phase, seconds, detail)
+    as each one finishes. Cache lookups made while warming up aren't
+    counted in the hit rates.
+
+    Usage:
+        for phase, elapsed, detail in warmup(["templates", "urls"]):
+            print(f"{phase}: {detail} in {elapsed:.3f}s")
+    """
+    for phase in phases or PHASES:
+        start = time.perf_counter()
+        with uncounted():
+            detail = PHASES[phase]()
+        yield phase, time.perf_counter() - start, detail
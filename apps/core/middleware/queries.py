@@ -0,0 +1,108 @@
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.template.defaultfilters import pluralize
+
+from ..management.queries import record_queries
+
+logger = logging.getLogger(__name__)
+
+
+def get_view_budget(view_func):
+    """The budget declared with @query_budget on a view or its class."""
+    for view in (
+        view_func,
+        getattr(view_func, "view_class", None),
+        getattr(view_func, "cls", None),
+    ):
+        budget = getattr(view, "query_budget", None)
+        if budget is not None:
+            return budget
+    return None
+
+
+class QueryBudgetMiddleware:
+    """
+    Record the queries of a sample of the requests (QUERY_BUDGET_SAMPLE_RATE)
+    and log the ones over budget:
+
+    - more queries, or more database time, than the view's @query_budget
+      (or QUERY_BUDGET_QUERIES/QUERY_BUDGET_MS for views without one)
+    - the same query shape run QUERY_BUDGET_REPEATS times or more, the sign
+      of an N+1 query in a loop
+
+    Sampled responses get a Server-Timing header with the query count and
+    database time when QUERY_BUDGET_SERVER_TIMING is set. Requests that
+    aren't sampled only cost a random number.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if settings.QUERY_BUDGET_SAMPLE_RATE <= 0:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if random.random() >= settings.QUERY_BUDGET_SAMPLE_RATE:
+            return self.get_response(request)
+        start = time.perf_counter()
+        with record_queries() as recorder:
+            response = self.get_response(request)
+        return self.process_response(request, response, recorder, start)
+
+    async def __acall__(self, request):
+        if random.random() >= settings.QUERY_BUDGET_SAMPLE_RATE:
+            return await self.get_response(request)
+        start = time.perf_counter()
+        with record_queries() as recorder:
+            response = await self.get_response(request)
+        return self.process_response(request, response, recorder, start)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = get_view_budget(view_func)
+
+    def process_response(self, request, response, recorder, start):
+        elapsed = (time.perf_counter() - start) * 1000
+        db_ms = recorder.duration * 1000
+
+        if settings.QUERY_BUDGET_SERVER_TIMING:
+            response.headers["Server-Timing"] = (
+                f'db;dur={db_ms:.1f};desc="{recorder.count} '
+                f'quer{pluralize(recorder.count, "y,ies")}", '
+                f"total;dur={elapsed:.1f}"
+            )
+
+        budget = {
+            "queries": settings.QUERY_BUDGET_QUERIES,
+            "ms": settings.QUERY_BUDGET_MS,
+        }
+        view_budget = getattr(request, "query_budget", None) or {}
+        budget.update((k, v) for k, v in view_budget.items() if v is not None)
+        max_queries, max_ms = budget["queries"], budget["ms"]
+        problems = []
+        if max_queries and recorder.count > max_queries:
+            problems.append(f"{recorder.count} queries (budget {max_queries})")
+        if max_ms and db_ms > max_ms:
+            problems.append(f"{db_ms:.1f} ms in the database (budget {max_ms} ms)")
+        for shape, count in recorder.get_repeated(settings.QUERY_BUDGET_REPEATS):
+            problems.append(f"likely N+1, run {count} times: {shape}")
+
+        if problems:
+            logger.warning(
+                "%s %s over query budget: %s",
+                request.method,
+                request.get_full_path(),
+                "; ".join(problems),
+            )
+        return response
@@ -0,0 +1,55 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from ..management.replica import replica_configured, request_state
+
+# Set on responses to requests that wrote, so the client's next requests
+# read from the primary until the replica has caught up
+PRIMARY_COOKIE = "db_primary"
+
+
+class ReplicaMiddleware:
+    """
+    Read-your-writes for the replica router: a request that writes reads
+    from the primary for the rest of the request, and so do the same
+    client's requests over the next DB_REPLICA_LAG seconds.
+
+    Placed before SessionMiddleware, so session saves count as writes.
+    Only enabled when a replica database is configured.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not replica_configured():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with request_state(PRIMARY_COOKIE in request.COOKIES) as state:
+            response = self.get_response(request)
+            return self.process_response(request, response, state)
+
+    async def __acall__(self, request):
+        with request_state(PRIMARY_COOKIE in request.COOKIES) as state:
+            response = await self.get_response(request)
+            return self.process_response(request, response, state)
+
+    def process_response(self, request, response, state):
+        if state.pinned and PRIMARY_COOKIE not in request.COOKIES:
+            response.set_cookie(
+                PRIMARY_COOKIE,
+                "1",
+                max_age=max(1, round(settings.DB_REPLICA_LAG)),
+                secure=request.is_secure(),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
@@ -0,0 +1,295 @@
+import mimetypes
+import re
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    HttpResponseNotAllowed,
+    HttpResponseNotFound,
+)
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from ..management.compress import is_compressible
+
+# Precompressed variants written by `buildstatic`, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+BLOCK_SIZE = 64 * 1024
+
+_range_re = re.compile(r"^bytes=(\d*)-(\d*)$")
+_encoding_re = re.compile(r"([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?")
+
+
+class FileRange:
+    """
+    Read-only view of `length` bytes of an open file, starting at `start`.
+
+    Keeps `fileno()` so the WSGI server can still sendfile() it: the file
+    position is the range start and the Content-Length is the range length.
+    """
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.name = file.name
+        self.remaining = length
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def get_accepted_encodings(request):
+    """Content codings the client accepts, ignoring the ones refused with q=0."""
+    accepted = set()
+    for coding, quality in _encoding_re.findall(
+        request.headers.get("Accept-Encoding", "")
+    ):
+        try:
+            if quality and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.lower())
+    return accepted
+
+
+def parse_range(header, size):
+    """
+    Parse a single `bytes=start-end` Range header.
+
+    Returns:
+        tuple | None: (start, length), None to serve the whole file, or
+            (None, None) when the range can't be satisfied
+    """
+    match = _range_re.match(header.strip())
+    if match is None:
+        # Multiple or malformed ranges: the whole file is a valid answer
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        length = min(int(end), size)
+        return (size - length, length) if length else (None, None)
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or end < start:
+        return None, None
+    return start, end - start + 1
+
+
+async def aiter_file(file, block_size=BLOCK_SIZE):
+    """Read a file in a worker thread, one block at a time."""
+    read = sync_to_async(file.read, thread_sensitive=False)
+    while data := await read(block_size):
+        yield data
+
+
+class StaticFilesMiddleware:
+    """
+    Serve STATIC_ROOT and MEDIA_ROOT before the rest of the middleware stack,
+    so deployments without a front proxy for `lib/` still serve files
+    efficiently. Requests under STATIC_URL/MEDIA_URL never reach the URL
+    resolver: they get the file, a 304/412/416, or a 404.
+
+    - Content-hashed static files (the values of the staticfiles manifest)
+      are served with a one year `immutable` Cache-Control, everything else
+      with STATIC_MAX_AGE.
+    - Precompressed `.br`/`.gz` variants are served when the client accepts
+      them, with `Vary: Accept-Encoding`.
+    - ETag/Last-Modified conditional requests and single `Range` requests
+      are supported. Ranges are served from the uncompressed file.
+    - Files are streamed from an open file object, which WSGI servers send
+      with sendfile(); ASGI servers read it in a worker thread.
+
+    Enabled by SERVE_STATIC.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.SERVE_STATIC:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+        self.mounts = []
+        for url, root, is_static in (
+            (settings.STATIC_URL, settings.STATIC_ROOT, True),
+            (settings.MEDIA_URL, settings.MEDIA_ROOT, False),
+        ):
+            url = urlsplit(url or "")
+            # Files on another host (e.g. a CDN) aren't ours to serve
+            if root and url.path and not url.netloc:
+                self.mounts.append((url.path, Path(root).resolve(), is_static))
+        self._immutable = None
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        response = self.serve(request)
+        if response is None:
+            response = self.get_response(request)
+        return response
+
+    async def __acall__(self, request):
+        response = self.serve(request)
+        if response is None:
+            return await self.get_response(request)
+        if isinstance(response, FileResponse) and response.file_to_stream:
+            response.streaming_content = aiter_file(response.file_to_stream)
+        return response
+
+    def get_immutable(self):
+        """Hashed names from the staticfiles manifest, loaded on first use."""
+        if self._immutable is None:
+            from django.contrib.staticfiles.storage import staticfiles_storage
+
+            hashed_files = getattr(staticfiles_storage, "hashed_files", {})
+            self._immutable = frozenset(hashed_files.values())
+        return self._immutable
+
+    def find_file(self, request):
+        """
+        Map a request to (path, relative name, is_static), or None if it isn't
+        under a served URL. The path is None when there's no such file.
+        """
+        for prefix, root, is_static in self.mounts:
+            if not request.path.startswith(prefix):
+                continue
+            name = request.path[len(prefix) :]
+            parts = name.split("/")
+            # No traversal, hidden files (e.g. temporary build files) or dirs
+            if not name or any(not part or part.startswith(".") for part in parts):
+                return None, name, is_static
+            if "\\" in name or "\0" in name:
+                return None, name, is_static
+
+            path = (root / name).resolve()
+            if not path.is_relative_to(root) or not path.is_file():
+                return None, name, is_static
+            return path, name, is_static
+        return None
+
+    def select_variant(self, request, path):
+        """Pick the precompressed variant the client accepts, if one exists."""
+        if "Range" in request.headers:
+            return path, None
+        accepted = get_accepted_encodings(request)
+        for encoding, suffix in ENCODINGS:
+            if encoding in accepted or "*" in accepted:
+                variant = path.with_name(path.name + suffix)
+                if variant.is_file():
+                    return variant, encoding
+        return path, None
+
+    def get_content_type(self, path):
+        content_type, _ = mimetypes.guess_type(path.name)
+        content_type = content_type or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in (
+            "application/javascript",
+            "application/json",
+            "image/svg+xml",
+        ):
+            content_type += "; charset=utf-8"
+        return content_type
+
+    def serve(self, request):
+        found = self.find_file(request)
+        if found is None:
+            return None
+        path, name, is_static = found
+
+        if request.method not in ("GET", "HEAD"):
+            return HttpResponseNotAllowed(["GET", "HEAD"])
+        if path is None:
+            return HttpResponseNotFound()
+
+        file_path, encoding = self.select_variant(request, path)
+        stat = file_path.stat()
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+        headers = HttpResponse()
+        headers["ETag"] = etag
+        headers["Last-Modified"] = http_date(stat.st_mtime)
+        headers["Accept-Ranges"] = "bytes"
+        if is_static and name in self.get_immutable():
+            headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            headers["Cache-Control"] = f"public, max-age={settings.STATIC_MAX_AGE}"
+        if is_compressible(path):
+            headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            headers["Content-Encoding"] = encoding
+
+        conditional = get_conditional_response(
+            request, etag=etag, last_modified=int(stat.st_mtime), response=headers
+        )
+        if conditional is not headers:
+            return conditional
+
+        status, start, length = 200, 0, stat.st_size
+        byte_range = request.headers.get("Range")
+        if byte_range and request.method == "GET" and self.range_applies(
+            request, headers
+        ):
+            parsed = parse_range(byte_range, stat.st_size)
+            if parsed == (None, None):
+                response = HttpResponse(status=416)
+                response["Content-Range"] = f"bytes */{stat.st_size}"
+                return response
+            if parsed is not None:
+                status, (start, length) = 206, parsed
+
+        if request.method == "HEAD":
+            response = HttpResponse(content_type=self.get_content_type(path))
+        else:
+            file = open(file_path, "rb")
+            if status == 206:
+                file = FileRange(file, start, length)
+            response = FileResponse(
+                file, status=status, content_type=self.get_content_type(path)
+            )
+            response.block_size = BLOCK_SIZE
+            # Named after the variant on disk, not the requested file
+            del response["Content-Disposition"]
+            if status == 206:
+                response["Content-Range"] = (
+                    f"bytes {start}-{start + length - 1}/{stat.st_size}"
+                )
+
+        for header, value in headers.items():
+            if header != "Content-Type":
+                response[header] = value
+        response["Content-Length"] = length
+        return response
+
+    def range_applies(self, request, headers):
+        """A Range with a stale If-Range validator gets the whole file instead."""
+        if_range = request.headers.get("If-Range")
+        return if_range is None or if_range in (
+            headers["ETag"],
+            headers["Last-Modified"],
+        )
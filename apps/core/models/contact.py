@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 from django.db import models
 from phonenumber_field.modelfields import PhoneNumberField
 
@@ -200,6 +201,23 @@ class ContactEmail(Contacts, Ordering):
     def __str__(self):
         return self.email
 
+    @classmethod
+    def get_primary_email(cls):
+        """
+        Returns the primary email address as a string, or None if no primary
+        is set. Read from the contact snapshot, so it is invalidated with the
+        rest of the contacts, including by queryset deletes.
+        """
+        from ..management.contacts import get_contact_snapshot
+
+        primary = get_contact_snapshot().primary_email
+        return primary.email if primary else None
+
+    @classmethod
+    async def aget_primary_email(cls):
+        """Async version of `get_primary_email()`, for async views."""
+        return await sync_to_async(cls.get_primary_email)()
+
     @property
     def mailto_link(self):
         """Returns a mailto: link for the email address"""
@@ -10,6 +10,7 @@ class ListCategory(Ordering, BootstrapIcon, DateFields):
 
     name = models.CharField(
         max_length=255,
+        db_index=True,
         help_text="Category name that groups related list items (e.g., 'Electronics', 'Furniture').",
     )
 
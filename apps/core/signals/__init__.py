@@ -0,0 +1,9 @@
+from ..apps import APP_NAME
+from ..utils import auto_import_dir_modules
+
+auto_import_dir_modules(APP_NAME, __file__)
+
+# * This file is used to automatically import all modules in the current directory.
+
+# Connected last so its on_commit callback runs after every cache invalidation
+from . import _publish  # noqa: E402, F401
@@ -0,0 +1,20 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ..management.publish import get_changed_pages, schedule_publish
+
+
+@receiver(post_save, dispatch_uid="core_publish_saved")
+@receiver(post_delete, dispatch_uid="core_publish_deleted")
+def publish_changed(sender, instance, **kwargs):
+    """Regenerate the pre-rendered pages showing a model once the change commits."""
+    if not settings.PUBLISH_ON_SAVE:
+        return
+
+    routes, object_pages = get_changed_pages(instance)
+    if routes or object_pages:
+        transaction.on_commit(partial(schedule_publish, routes, object_pages))
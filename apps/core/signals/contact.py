@@ -0,0 +1,26 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from ..management.contacts import invalidate_contact_snapshot
+from ..models.contact import (
+    ContactAddress,
+    ContactEmail,
+    ContactNumber,
+    ContactSocialLink,
+)
+
+CONTACT_MODELS = (ContactSocialLink, ContactNumber, ContactEmail, ContactAddress)
+
+
+def contact_changed(sender, **kwargs):
+    """Bump the contacts version once the change is committed."""
+    transaction.on_commit(invalidate_contact_snapshot)
+
+
+for model in CONTACT_MODELS:
+    post_save.connect(
+        contact_changed, sender=model, dispatch_uid=f"core_{model.__name__}_saved"
+    )
+    post_delete.connect(
+        contact_changed, sender=model, dispatch_uid=f"core_{model.__name__}_deleted"
+    )
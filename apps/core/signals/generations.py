@@ -0,0 +1,33 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from ..management.cache import bump_model_generation, is_tracked
+from ..management.replica import replica_configured
+
+
+def bump_after_commit(*models):
+    """
+    Bump the generation of each model some cache key depends on once the
+    current transaction commits. With a replica every model is bumped: the
+    router reads the bump times to know what the replica has caught up on.
+    """
+    if not replica_configured():
+        models = [model for model in models if is_tracked(model)]
+    for model in set(models):
+        transaction.on_commit(partial(bump_model_generation, model))
+
+
+@receiver(post_save, dispatch_uid="core_generation_saved")
+@receiver(post_delete, dispatch_uid="core_generation_deleted")
+def model_changed(sender, **kwargs):
+    bump_after_commit(sender)
+
+
+@receiver(m2m_changed, dispatch_uid="core_generation_m2m_changed")
+def m2m_relation_changed(sender, instance, action, model, **kwargs):
+    # sender is the through model; both sides of the relation are affected
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_after_commit(sender, instance.__class__, model)
@@ -0,0 +1,21 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from ..management.lists import invalidate_lists
+from ..models.list import ListCategory, ListItem
+
+LIST_MODELS = (ListCategory, ListItem)
+
+
+def list_changed(sender, **kwargs):
+    """Bump the lists version once the change is committed."""
+    transaction.on_commit(invalidate_lists)
+
+
+for model in LIST_MODELS:
+    post_save.connect(
+        list_changed, sender=model, dispatch_uid=f"core_{model.__name__}_saved"
+    )
+    post_delete.connect(
+        list_changed, sender=model, dispatch_uid=f"core_{model.__name__}_deleted"
+    )
@@ -0,0 +1,9 @@
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from ..management.queries import install_recorder
+
+
+@receiver(connection_created, dispatch_uid="core_query_recorder")
+def add_query_recorder(sender, connection, **kwargs):
+    install_recorder(connection)
@@ -0,0 +1,10 @@
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from ..management.sqlite import apply_pragmas
+
+
+@receiver(connection_created, dispatch_uid="core_sqlite_pragmas")
+def set_sqlite_pragmas(sender, connection, **kwargs):
+    if connection.vendor == "sqlite":
+        apply_pragmas(connection)
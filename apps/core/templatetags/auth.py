@@ -1,7 +1,8 @@
 from django import template
-from django.urls import NoReverseMatch, reverse
+from django.urls import NoReverseMatch
 
 from ..management.config.auth import auth_config
+from ..management.config.urls import urls_config
 
 register = template.Library()
 
@@ -32,7 +33,7 @@ def auth_url(page_name):
     url_name = URL_MAPPINGS.get(page_name)
     if url_name:
         try:
-            return reverse(url_name)
+            return urls_config.reverse(url_name)
         except NoReverseMatch:
             return ""
     return ""
@@ -76,7 +77,7 @@ def auth_urls():
         url_name = URL_MAPPINGS.get(page_name)
         if url_name:
             try:
-                auth_urls_dict[page_name] = reverse(url_name)
+                auth_urls_dict[page_name] = urls_config.reverse(url_name)
             except NoReverseMatch:
                 continue
 
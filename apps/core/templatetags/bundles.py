@@ -0,0 +1,54 @@
+from functools import cache
+
+from django import template
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from ..management.config.bundles import bundle_config
+
+register = template.Library()
+
+
+def render_tags(css, js):
+    links = format_html_join(
+        "\n", '<link rel="stylesheet" href="{}">', ((static(path),) for path in css)
+    )
+    scripts = format_html_join(
+        "\n", '<script defer src="{}"></script>', ((static(path),) for path in js)
+    )
+    return format_html("{}\n{}", links, scripts)
+
+
+@cache
+def render_bundle(name):
+    """
+    Render the tags of a bundle: one <link> and one <script> pointing at
+    the built, content-hashed bundle files, or one tag per source file when
+    STATIC_BUNDLES is off (the default in DEBUG).
+    """
+    files = bundle_config.get(name)
+    if not settings.STATIC_BUNDLES:
+        return render_tags(files["css"], files["js"])
+
+    css = [bundle_config.get_output_path(name, "css")] if files["css"] else []
+    js = [bundle_config.get_output_path(name, "js")] if files["js"] else []
+    return render_tags(css, js)
+
+
+@register.simple_tag
+def bundle(name):
+    """
+    Emit the stylesheets and scripts of a registered static bundle.
+    Usage:
+      - {% bundle "core" %}
+    """
+    return render_bundle(name)
+
+
+@receiver(setting_changed)
+def clear_rendered_bundles(*, setting, **kwargs):
+    if setting in ("DEBUG", "STATIC_BUNDLES", "STATIC_URL", "STORAGES"):
+        render_bundle.cache_clear()
@@ -1,12 +1,7 @@
 from django import template
 from django.utils.html import format_html
 
-from ..models.contact import (
-    ContactAddress,
-    ContactEmail,
-    ContactNumber,
-    ContactSocialLink,
-)
+from ..management.contacts import get_contact_snapshot
 
 register = template.Library()
 
@@ -23,7 +18,7 @@ def get_social_links():
 
     Usage: {% get_social_links as social_links %}
     """
-    return ContactSocialLink.objects.filter(is_active=True)
+    return get_contact_snapshot().social_links
 
 
 # ============================================================================
@@ -38,7 +33,7 @@ def get_phone_numbers():
 
     Usage: {% get_phone_numbers as phone_numbers %}
     """
-    return ContactNumber.objects.filter(is_active=True)
+    return get_contact_snapshot().phone_numbers
 
 
 @register.simple_tag
@@ -48,10 +43,7 @@ def primary_phone():
 
     Usage: {% primary_phone as main_phone %}
     """
-    try:
-        return ContactNumber.objects.get(is_primary=True, is_active=True)
-    except ContactNumber.DoesNotExist:
-        return None
+    return get_contact_snapshot().primary_phone
 
 
 @register.simple_tag
@@ -61,10 +53,7 @@ def whatsapp_phone():
 
     Usage: {% whatsapp_phone as whatsapp %}
     """
-    try:
-        return ContactNumber.objects.get(use_for_whatsapp=True, is_active=True)
-    except ContactNumber.DoesNotExist:
-        return None
+    return get_contact_snapshot().whatsapp_phone
 
 
 # ============================================================================
@@ -79,7 +68,7 @@ def get_email_addresses():
 
     Usage: {% get_email_addresses as email_addresses %}
     """
-    return ContactEmail.objects.filter(is_active=True)
+    return get_contact_snapshot().email_addresses
 
 
 @register.simple_tag
@@ -89,10 +78,7 @@ def primary_email():
 
     Usage: {% primary_email as main_email %}
     """
-    try:
-        return ContactEmail.objects.get(is_primary=True, is_active=True)
-    except ContactEmail.DoesNotExist:
-        return None
+    return get_contact_snapshot().primary_email
 
 
 @register.simple_tag
@@ -131,7 +117,7 @@ def get_physical_addresses():
 
     Usage: {% get_physical_addresses as addresses %}
     """
-    return ContactAddress.objects.filter(is_active=True)
+    return get_contact_snapshot().physical_addresses
 
 
 @register.simple_tag
@@ -141,10 +127,7 @@ def contact_form_address():
 
     Usage: {% contact_form_address as main_address %}
     """
-    try:
-        return ContactAddress.objects.get(use_in_contact_form=True, is_active=True)
-    except ContactAddress.DoesNotExist:
-        return None
+    return get_contact_snapshot().contact_form_address
 
 
 @register.simple_tag
@@ -195,13 +178,4 @@ def get_contact_info():
 
     Usage: {% get_contact_info as contact %}
     """
-    return {
-        "social_links": ContactSocialLink.objects.filter(is_active=True),
-        "phone_numbers": ContactNumber.objects.filter(is_active=True),
-        "email_addresses": ContactEmail.objects.filter(is_active=True),
-        "physical_addresses": ContactAddress.objects.filter(is_active=True),
-        "primary_phone": primary_phone(),
-        "whatsapp_phone": whatsapp_phone(),
-        "primary_email": primary_email(),
-        "contact_form_address": contact_form_address(),
-    }
+    return get_contact_snapshot().as_dict()
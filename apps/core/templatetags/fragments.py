@@ -0,0 +1,104 @@
+from django import template
+from django.core.cache.utils import make_template_fragment_key
+
+from ..management.cache import (
+    get_cache,
+    get_model_generations,
+    get_or_refresh,
+    get_static_hash,
+    resolve_models,
+)
+
+register = template.Library()
+
+FRAGMENT_OPTIONS = ("depends_on", "timeout")
+
+
+class CachedFragmentNode(template.Node):
+    def __init__(self, nodelist, fragment_name, vary_on, options):
+        self.nodelist = nodelist
+        self.fragment_name = fragment_name
+        self.vary_on = vary_on
+        self.options = options
+
+    def render(self, context):
+        fragment_name = self.fragment_name.resolve(context)
+        depends_on = self.options.get("depends_on")
+        timeout = self.options.get("timeout")
+
+        models = resolve_models(depends_on.resolve(context) or "") if depends_on else ()
+        vary_on = [var.resolve(context) for var in self.vary_on]
+        vary_on += get_model_generations(models)
+        vary_on.append(get_static_hash())
+
+        key = make_template_fragment_key(fragment_name, vary_on)
+        if timeout:
+            # Past its timeout, one render refreshes the fragment while the
+            # others keep serving the previous one
+            return get_or_refresh(
+                key,
+                lambda: self.nodelist.render(context),
+                soft_ttl=timeout.resolve(context),
+                alias="templates",
+                stats_key=f"fragment:{fragment_name}",
+            )
+
+        fragment_cache = get_cache("templates")
+        value = fragment_cache.get(key)
+        if value is None:
+            value = self.nodelist.render(context)
+            fragment_cache.set(key, value, None)
+        return value
+
+
+@register.tag("cached_fragment")
+def do_cached_fragment(parser, token):
+    """
+    Cache a template fragment until one of the models it depends on changes.
+
+    The key includes a generation counter per model listed in `depends_on`,
+    bumped on every save, delete or many-to-many change of that model, so
+    the fragment can be cached indefinitely (a rebuild of the static files
+    starts new entries too). Any extra positional arguments are varied on
+    like Django's {% cache %} tag. `timeout` is optional:
+    fragments that also change with time are re-rendered once it has passed,
+    by one request while the others are served the previous render (see
+    `get_or_refresh()`, whose counters are kept under 'fragment:<name>').
+    Models in a literal depends_on are tracked automatically; track those of
+    a depends_on taken from the context with `track_models()`.
+
+    Usage:
+        {% load fragments %}
+        {% cached_fragment "portfolio" depends_on="custom.Item custom.Category" %}
+            ...
+        {% endcached_fragment %}
+
+        {% cached_fragment "features" features_title_heading depends_on="core.ListItem" timeout=3600 %}
+            ...
+        {% endcached_fragment %}
+    """
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' tag requires at least a fragment name."
+        )
+
+    nodelist = parser.parse(("endcached_fragment",))
+    parser.delete_first_token()
+
+    vary_on = []
+    options = {}
+    for bit in bits[2:]:
+        name, _, value = bit.partition("=")
+        if value and name in FRAGMENT_OPTIONS:
+            if name in options:
+                raise template.TemplateSyntaxError(
+                    f"'{bits[0]}' received '{name}' more than once."
+                )
+            options[name] = parser.compile_filter(value)
+        else:
+            vary_on.append(parser.compile_filter(bit))
+
+    return CachedFragmentNode(
+        nodelist, parser.compile_filter(bits[1]), vary_on, options
+    )
@@ -1,15 +1,15 @@
 from django import template
 
-from ..models.list import ListItem
+from ..management.lists import get_list
 
 register = template.Library()
 
 
 @register.simple_tag()
 def list_features():
-    return ListItem.objects.filter(category__name="Features")
+    return get_list("Features")
 
 
 @register.simple_tag()
 def list_faq():
-    return ListItem.objects.filter(category__name="FAQ")
+    return get_list("FAQ")
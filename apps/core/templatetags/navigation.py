@@ -1,6 +1,6 @@
 from django import template
 from django.conf import settings
-from django.urls import NoReverseMatch, reverse
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf, reverse
 from django.utils.safestring import mark_safe
 
 from ..management.config.navigation import nav_config
@@ -181,10 +181,20 @@ def render_regular_item(nav_type, item, icon_class=""):
     '''
 
 
-@register.simple_tag(takes_context=True)
-def navmenu(context, icon_class=""):
-    request = context.get("request")
-    nav_type = settings.SITE_NAVIGATION_TYPE
+def get_auth_state(request):
+    """
+    Reduce a request to the only thing the menu output depends on:
+    None without a request, otherwise whether the user is authenticated.
+    """
+    if not request:
+        return None
+    return request.user.is_authenticated
+
+
+def render_navmenu(nav_type, icon_class="", request=None):
+    """
+    Render the full navigation menu HTML for a nav type and request.
+    """
     nav_items = build_nav_items(nav_config.get_items(), request)
 
     html_items = []
@@ -198,6 +208,33 @@ def navmenu(context, icon_class=""):
     return mark_safe(html.strip())
 
 
+@register.simple_tag(takes_context=True)
+def navmenu(context, icon_class=""):
+    """
+    Render the navigation menu.
+
+    The output only varies by URLconf, navigation type, icon class and
+    authentication state, so it is rendered once per combination and then
+    served from nav_config's render cache.
+    """
+    request = context.get("request")
+    nav_type = settings.SITE_NAVIGATION_TYPE
+    key = (
+        get_urlconf(),
+        get_script_prefix(),
+        nav_type,
+        icon_class,
+        get_auth_state(request),
+    )
+
+    html = nav_config.get_rendered(key)
+    if html is None:
+        html = nav_config.set_rendered(
+            key, render_navmenu(nav_type, icon_class, request)
+        )
+    return html
+
+
 @register.simple_tag()
 def navigation_type():
     return settings.SITE_NAVIGATION_TYPE
@@ -1,5 +1,10 @@
+from functools import cache
+
 from django import template
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.loader import render_to_string
 from django.utils.safestring import mark_safe
 
 register = template.Library()
@@ -103,3 +108,43 @@ def site_title(context, title=None, separator=" | "):
     full_title = f"{title}{separator}{site_name}" if title else site_name
 
     return mark_safe(f"<title>{full_title}</title>")
+
+
+@cache
+def render_site_head():
+    """
+    Render the <head> metadata block (meta, icons, manifest, theme color)
+    from the SITE_* settings. Rendered once per process.
+    """
+    site = {
+        "url": settings.SITE_URL,
+        "name": settings.SITE_NAME,
+        "description": settings.SITE_DESCRIPTION,
+        "keywords": settings.SITE_KEYWORDS,
+        "theme_color": settings.SITE_THEME_COLOR,
+        "author": settings.SITE_AUTHOR,
+        "logo": settings.SITE_LOGO,
+        "favicon": settings.SITE_FAVICON,
+        "apple_touch_icon": settings.SITE_APPLE_TOUCH_ICON,
+        "android_chrome_icon": settings.SITE_ANDROID_CHROME_ICON,
+        "mstile": settings.SITE_MSTILE,
+        "manifest": settings.SITE_MANIFEST,
+    }
+    return mark_safe(render_to_string("core/partials/site_head.html", {"site": site}))
+
+
+@register.simple_tag
+def site_head():
+    """
+    Render the full <head> metadata block. Use {% site_title %} alongside it
+    for the per-page <title>.
+
+    Usage: {% site_head %}
+    """
+    return render_site_head()
+
+
+@receiver(setting_changed)
+def _reset_site_head(*, setting, **kwargs):
+    if setting.startswith("SITE_"):
+        render_site_head.cache_clear()
@@ -74,7 +74,7 @@ def signout(request):
     """
     logout(request)
     messages.success(request, "You have been successfully logged out.")
-    return redirect(urls_config.get_landing_url_name())
+    return redirect(urls_config.get_landing_url())
 
 
 @auth_page_required_class("signup")
@@ -1,9 +1,9 @@
 import json
 import logging
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
-from django.db import connection
 from django.http import JsonResponse
 from django.template.loader import render_to_string
 from django.utils.decorators import method_decorator
@@ -18,9 +18,14 @@ logger = logging.getLogger(__name__)
 
 @method_decorator(csrf_exempt, name="dispatch")
 class MailUsAPIView(View):
-    """Handle contact form submission"""
+    """
+    Handle contact form submission.
 
-    def post(self, request):
+    Async, so a slow SMTP server holds a coroutine rather than a worker
+    thread when served over ASGI. The blocking send runs in a thread pool.
+    """
+
+    async def post(self, request):
         try:
             # Parse JSON data
             data = json.loads(request.body)
@@ -48,16 +53,8 @@ class MailUsAPIView(View):
             try:
                 if hasattr(settings, "CONTACT_EMAIL"):
                     recipient_email = settings.CONTACT_EMAIL
-                elif (
-                    "ContactEmail" in globals()
-                    and ContactEmail._meta.db_table
-                    in connection.introspection.table_names()
-                ):
-                    contact_email_obj = ContactEmail.objects.filter(
-                        is_primary=True
-                    ).first()
-                    if contact_email_obj:
-                        recipient_email = contact_email_obj.email
+                else:
+                    recipient_email = await ContactEmail.aget_primary_email()
 
                 if not recipient_email:
                     recipient_email = getattr(
@@ -93,7 +90,7 @@ class MailUsAPIView(View):
                 reply_to=[sender_email],
             )
             msg.attach_alternative(html_content, "text/html")
-            msg.send()
+            await sync_to_async(msg.send, thread_sensitive=False)()
 
             return JsonResponse(
                 {
@@ -117,7 +114,7 @@ class MailUsAPIView(View):
                 status=500,
             )
 
-    def get(self, request):
+    async def get(self, request):
         """Optional: Handle GET requests"""
         return JsonResponse(
             {"success": False, "message": "Only POST requests are allowed."}, status=405
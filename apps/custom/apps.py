@@ -15,8 +15,14 @@ class CustomConfig(AppConfig):
         try:
             from apps.core.management.config.auth import auth_config
             from apps.core.management.config.navigation import nav_config
+            from apps.core.management.config.publish import (
+                SITE_DEPENDS_ON,
+                publish_config,
+            )
             from apps.core.management.config.urls import urls_config
 
+            from .models.stock import Item
+
             # Configure landing url
             urls_config.register_landing_url("landing", self.name)
 
@@ -57,6 +63,17 @@ class CustomConfig(AppConfig):
                 icon="bi bi-envelope",
             )
 
+            # Pre-rendered pages (the contact page embeds a CSRF token)
+            publish_config.register("landing", depends_on=SITE_DEPENDS_ON)
+            publish_config.register("portfolio", depends_on=SITE_DEPENDS_ON)
+            publish_config.register("features", depends_on=SITE_DEPENDS_ON)
+            publish_config.register(
+                "item-detail",
+                queryset=lambda: Item.objects.all(),
+                url_kwargs=lambda item: {"id": item.pk},
+                depends_on="custom.Category custom.ItemImage",
+            )
+
             logger.info(f"{self.name} configured successfully")
 
         except Exception as e:
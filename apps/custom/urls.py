@@ -1,6 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from .views.catalog import CategoryDetailView, CategoryItemsView, CategoryListView
 from .views.home import ContactView, FeaturesView, LandingView, PortfolioView
 from .views.stock import CategoryViewSet, ItemDetailView
 
@@ -12,6 +13,21 @@ urlpatterns = [
     path("products", PortfolioView.as_view(), name="portfolio"),
     path("contact/", ContactView.as_view(), name="contact"),
     path("features", FeaturesView.as_view(), name="features"),
+    path(
+        "api/catalog/categories/",
+        CategoryListView.as_view(),
+        name="catalog-category-list",
+    ),
+    path(
+        "api/catalog/categories/<int:pk>/",
+        CategoryDetailView.as_view(),
+        name="catalog-category-detail",
+    ),
+    path(
+        "api/catalog/categories/<int:pk>/items/",
+        CategoryItemsView.as_view(),
+        name="catalog-category-items",
+    ),
     path("api/", include(api.urls)),
     path(
         "swaps/portfolio/item/<int:id>/",
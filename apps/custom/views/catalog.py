@@ -0,0 +1,167 @@
+import hashlib
+from decimal import Decimal
+
+from django.db.models import Count, Q
+from django.http import Http404, JsonResponse
+from django.shortcuts import aget_object_or_404
+from django.urls import reverse
+from django.views.generic import View
+
+from apps.core.decorators.db import query_budget, read_from_replica_class
+from apps.core.management.cache import (
+    aget_model_generations,
+    get_cache,
+    track_models,
+)
+
+from ..models.stock import Category, Item
+
+CATALOG_CACHE_ALIAS = "api"
+
+# Models every catalog response is built from
+CATALOG_MODELS = (Category, Item)
+track_models(CATALOG_MODELS)
+
+
+def image_url(request, image):
+    return request.build_absolute_uri(image.url) if image else None
+
+
+def category_data(request, category):
+    """A category in the shape of CategoryListSerializer."""
+    return {
+        "url": request.build_absolute_uri(
+            reverse("catalog-category-detail", args=[category.pk])
+        ),
+        "id": category.pk,
+        "name": category.name,
+        "image": image_url(request, category.image),
+        "bootstrap_icon": category.bootstrap_icon,
+        "is_active": category.is_active,
+        "item_count": category.item_count,
+    }
+
+
+def item_data(request, item):
+    """An item in the shape of ItemListSerializer."""
+    return {
+        "id": item.pk,
+        "name": item.name,
+        "main_image": image_url(request, item.main_image),
+        "category_name": item.category.name,
+        "original_price": item.original_price,
+        "current_price": item.current_price,
+        "discount_percentage": round(Decimal(item.discount_percentage), 2),
+        "is_featured": item.is_featured,
+        "is_in_stock": item.is_in_stock,
+        "available_quantity": item.available_quantity,
+        "bootstrap_icon": item.bootstrap_icon,
+    }
+
+
+async def cached_json(request, build):
+    """
+    Serve the JSON built by the async `build()` from the api cache, keyed by
+    the URL (with its scheme and host, as the payloads hold absolute URLs)
+    and the generations of the catalog models, so any change to a category
+    or item is visible on the next request.
+    """
+    cache = get_cache(CATALOG_CACHE_ALIAS)
+    generations = await aget_model_generations(CATALOG_MODELS)
+    parts = [request.scheme, request.get_host(), request.get_full_path(), *generations]
+    digest = hashlib.md5("|".join(map(str, parts)).encode()).hexdigest()
+    key = f"catalog:{request.path}:{digest}"
+
+    data = await cache.aget(key)
+    if data is None:
+        data = await build()
+        await cache.aset(key, data)
+    return JsonResponse(data, safe=False)
+
+
+def active_items(category_pk):
+    return Item.objects.filter(
+        category_id=category_pk, is_active=True
+    ).select_related("category")
+
+
+@query_budget(queries=5)
+@read_from_replica_class
+class CategoryListView(View):
+    """
+    Async version of the CategoryViewSet list endpoint.
+
+    - GET /api/catalog/categories/?is_active=true&search=name
+    """
+
+    async def get(self, request):
+        async def build():
+            categories = Category.objects.annotate(
+                item_count=Count("items", filter=Q(items__is_active=True))
+            )
+            is_active = request.GET.get("is_active")
+            if is_active in ("true", "True", "1"):
+                categories = categories.filter(is_active=True)
+            elif is_active in ("false", "False", "0"):
+                categories = categories.filter(is_active=False)
+            if search := request.GET.get("search"):
+                categories = categories.filter(name__icontains=search)
+            return [category_data(request, category) async for category in categories]
+
+        return await cached_json(request, build)
+
+
+@query_budget(queries=5)
+@read_from_replica_class
+class CategoryDetailView(View):
+    """
+    Async version of the CategoryViewSet retrieve endpoint, in the shape of
+    CategoryDetailSerializer.
+
+    - GET /api/catalog/categories/{id}/
+    """
+
+    async def get(self, request, pk):
+        async def build():
+            category = await aget_object_or_404(Category, pk=pk)
+            return {
+                "id": category.pk,
+                "name": category.name,
+                "description": category.description,
+                "image": image_url(request, category.image),
+                "bootstrap_icon": category.bootstrap_icon,
+                "is_active": category.is_active,
+                "order": category.order,
+                "created_at": category.created_at,
+                "updated_at": category.updated_at,
+                "active_items": [
+                    item_data(request, item) async for item in active_items(pk)[:10]
+                ],
+                "total_items": await category.items.acount(),
+            }
+
+        try:
+            return await cached_json(request, build)
+        except Http404:
+            return JsonResponse({"detail": "Not found."}, status=404)
+
+
+@query_budget(queries=5)
+@read_from_replica_class
+class CategoryItemsView(View):
+    """
+    Async version of the CategoryViewSet items action.
+
+    - GET /api/catalog/categories/{id}/items/
+    """
+
+    async def get(self, request, pk):
+        async def build():
+            if not await Category.objects.filter(pk=pk).aexists():
+                raise Http404
+            return [item_data(request, item) async for item in active_items(pk)]
+
+        try:
+            return await cached_json(request, build)
+        except Http404:
+            return JsonResponse({"detail": "Not found."}, status=404)
@@ -1,7 +1,14 @@
 from django.views.generic import TemplateView
 
+from apps.core.decorators.cache import cache_anonymous_page_class
+from apps.core.management.config.publish import SITE_DEPENDS_ON
+
+# Models rendered on every marketing page (navigation, contacts, lists)
+PAGE_DEPENDS_ON = SITE_DEPENDS_ON
+
 
 # Landing Page
+@cache_anonymous_page_class(depends_on=PAGE_DEPENDS_ON)
 class LandingView(TemplateView):
     template_name = "custom/index.html"
     extra_context = {
@@ -14,6 +21,7 @@ class LandingView(TemplateView):
     }
 
 
+@cache_anonymous_page_class(depends_on=PAGE_DEPENDS_ON)
 class PortfolioView(TemplateView):
     template_name = "custom/index.html"
     extra_context = {
@@ -25,6 +33,7 @@ class PortfolioView(TemplateView):
 
 
 # Features Page
+@cache_anonymous_page_class(depends_on=PAGE_DEPENDS_ON)
 class FeaturesView(TemplateView):
     template_name = "custom/index.html"
     extra_context = {
@@ -34,7 +43,7 @@ class FeaturesView(TemplateView):
     }
 
 
-# Contact Page
+# Contact Page (not page-cached: the form sets a CSRF cookie on every response)
 class ContactView(TemplateView):
     template_name = "custom/index.html"
     extra_context = {
@@ -1,5 +1,6 @@
+from asgiref.sync import sync_to_async
 from django.http import HttpResponse
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404
 from django.template.loader import render_to_string
 from django.views.generic import View
 from django_filters.rest_framework import DjangoFilterBackend
@@ -8,6 +9,8 @@ from rest_framework.filters import SearchFilter
 from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
 
+from apps.core.decorators.db import query_budget, read_from_replica_class
+
 from ..models.stock import Category, Item
 from ..serializers.stock import (
     CategoryDetailSerializer,
@@ -16,6 +19,8 @@ from ..serializers.stock import (
 )
 
 
+@query_budget(queries=5)
+@read_from_replica_class
 class CategoryViewSet(ReadOnlyModelViewSet):
     queryset = Category.objects.all()
     filter_backends = [DjangoFilterBackend, SearchFilter]
@@ -49,12 +54,22 @@ class CategoryViewSet(ReadOnlyModelViewSet):
         return Response(serializer.data)
 
 
+@query_budget(queries=5)
+@read_from_replica_class
 class ItemDetailView(View):
-    def get(self, request, id):
-        item = get_object_or_404(Item, pk=id)
+    async def get(self, request, id):
+        item = await aget_object_or_404(
+            Item.objects.select_related("category").prefetch_related(
+                "other_images"
+            ),
+            pk=id,
+        )
         extra_context = {"item": item}
 
-        html = render_to_string("custom/swaps/item.html", extra_context)
+        # The template's tags may still query (e.g. {% list_features %})
+        html = await sync_to_async(render_to_string)(
+            "custom/swaps/item.html", extra_context
+        )
         return HttpResponse(html)
 
 
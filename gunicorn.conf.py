@@ -0,0 +1,111 @@
+"""
+Gunicorn configuration for dms, read from the project root by default:
+
+    gunicorn settings.core.wsgi:application
+
+The app is imported once in the master (preload_app) and the workers are
+forked from it, so they share the memory holding Django, the apps and the
+URLconf instead of each importing its own copy.
+
+For more information on these settings, see
+https://docs.gunicorn.org/en/stable/settings.html
+"""
+
+import gc
+import os
+
+# Not imported as `config`: gunicorn would read it as its own config setting
+from decouple import config as env
+
+from apps.core.checks import get_server_concurrency
+
+wsgi_app = "settings.core.wsgi:application"
+bind = env("GUNICORN_BIND", default="127.0.0.1:8000")
+
+# Workers and threads (see apps/core/checks.py, which checks them against
+# the database connection limits)
+workers, threads = get_server_concurrency()
+timeout = env("GUNICORN_TIMEOUT", cast=int, default=30)
+graceful_timeout = timeout
+keepalive = 5
+
+# Restart workers after a number of requests to bound memory growth. The
+# jitter spreads restarts out so the workers don't all restart at once.
+max_requests = env("GUNICORN_MAX_REQUESTS", cast=int, default=1000)
+max_requests_jitter = env(
+    "GUNICORN_MAX_REQUESTS_JITTER", cast=int, default=max_requests // 10
+)
+
+preload_app = env("GUNICORN_PRELOAD", cast=bool, default=True)
+
+# Worker heartbeats go to a file: keep it in memory rather than on disk.
+# Falls back to gunicorn's default (the system temp dir) where there's no
+# such directory, e.g. on macOS
+worker_tmp_dir = env("GUNICORN_WORKER_TMP_DIR", default="/dev/shm")
+if not os.path.isdir(worker_tmp_dir):
+    worker_tmp_dir = None
+
+
+def log_warmup(log, phases):
+    from apps.core.management.warmup import warmup
+
+    try:
+        for phase, elapsed, detail in warmup(phases):
+            log.info("Warmup %s: %s in %.1f ms", phase, detail, elapsed * 1000)
+    except Exception:
+        # Warming up only saves time: serve without it rather than not at all
+        log.exception("Warmup failed")
+
+
+def when_ready(server):
+    """
+    Finish loading in the master before the first worker is forked, then
+    freeze the objects created so far. Frozen objects are left alone by the
+    garbage collector, so the workers' collections don't write to the pages
+    they share with the master (copy-on-write).
+    """
+    if not server.cfg.preload_app:
+        return
+
+    from django.db import connections
+
+    from apps.core.management.warmup import LOCAL_PHASES
+
+    # Templates, URL resolvers and menus are otherwise loaded lazily, on
+    # each worker's first requests
+    log_warmup(server.log, LOCAL_PHASES)
+    # Connections opened while loading mustn't be shared with the workers
+    connections.close_all()
+
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """
+    Drop the database and cache connections inherited from the master: a
+    socket used by two processes mixes their queries. Each worker opens its
+    own on first use.
+    """
+    if not server.cfg.preload_app:
+        return
+
+    from django.core.cache import caches
+    from django.db import connections
+
+    connections.close_all()
+    caches.close_all()
+
+
+def post_worker_init(worker):
+    """
+    With GUNICORN_WARMUP, open the worker's connections and fill the
+    application caches before it accepts requests (and, without preloading,
+    compile its templates and populate its URL resolvers too).
+    """
+    if not env("GUNICORN_WARMUP", cast=bool, default=False):
+        return
+
+    from apps.core.management.warmup import PHASES, WORKER_PHASES
+
+    log_warmup(worker.log, WORKER_PHASES if worker.cfg.preload_app else PHASES)
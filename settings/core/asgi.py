@@ -16,5 +16,7 @@ os.environ.setdefault(
     "DJANGO_SETTINGS_MODULE",
     config("DJANGO_SETTINGS_MODULE", default="settings.core.conf"),
 )
+# Tells the settings (and `manage.py check`) that requests are served async
+os.environ.setdefault("DJANGO_ASGI", "True")
 
 application = get_asgi_application()
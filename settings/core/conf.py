@@ -51,6 +51,9 @@ if DEBUG:
 
 ROOT_URLCONF = config("ROOT_URLCONF", default="settings.core.urls")
 WSGI_APPLICATION = "settings.core.wsgi.application"
+ASGI_APPLICATION = "settings.core.asgi.application"
+# Set by settings/core/asgi.py when serving with uvicorn
+ASGI_SERVER = config("DJANGO_ASGI", cast=bool, default=False)
 
 
 # Site-specific settings
@@ -93,6 +96,14 @@ if DB_BACKEND == "sqlite3":
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": LIB_DIR / f"{config('DB_NAME', default='db')}.sqlite3",
+            "OPTIONS": {
+                # Take the write lock when a transaction starts instead of
+                # upgrading a read lock later, which fails with "database is
+                # locked" when another connection is writing
+                "transaction_mode": config(
+                    "SQLITE_TRANSACTION_MODE", default="IMMEDIATE"
+                ),
+            },
         }
     }
 else:
@@ -104,9 +115,140 @@ else:
             "PASSWORD": config("DB_PASSWORD", default="postgres"),
             "HOST": config("DB_HOST", default="localhost"),
             "PORT": config("DB_PORT", default="5432"),
+            # Reuse connections across requests instead of reconnecting each time
+            "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", cast=int, default=60),
+            "CONN_HEALTH_CHECKS": config(
+                "DB_CONN_HEALTH_CHECKS", cast=bool, default=True
+            ),
         }
     }
 
+    # Optional read replica, used by the views and loaders that opt in
+    # (see apps.core.management.replica.ReplicaRouter)
+    if config("DB_REPLICA_HOST", default=""):
+        DATABASES["replica"] = {
+            **DATABASES["default"],
+            "NAME": config("DB_REPLICA_NAME", default=DATABASES["default"]["NAME"]),
+            "USER": config("DB_REPLICA_USER", default=DATABASES["default"]["USER"]),
+            "PASSWORD": config(
+                "DB_REPLICA_PASSWORD", default=DATABASES["default"]["PASSWORD"]
+            ),
+            "HOST": config("DB_REPLICA_HOST"),
+            "PORT": config("DB_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+            "TEST": {"MIRROR": "default"},
+        }
+        DATABASE_ROUTERS = ["apps.core.management.replica.ReplicaRouter"]
+
+    # psycopg 3 connection pool (Django 5.1+), one per worker process.
+    # Replaces persistent connections, which Django doesn't allow with a pool.
+    # Checked against WEB_CONCURRENCY/GUNICORN_THREADS by `manage.py check`
+    if DB_BACKEND == "postgresql" and config("DB_POOL", cast=bool, default=False):
+        for database in DATABASES.values():
+            database["CONN_MAX_AGE"] = 0
+            database["OPTIONS"] = {
+                "pool": {
+                    "min_size": config("DB_POOL_MIN_SIZE", cast=int, default=2),
+                    "max_size": config("DB_POOL_MAX_SIZE", cast=int, default=4),
+                    "timeout": config("DB_POOL_TIMEOUT", cast=float, default=10),
+                }
+            }
+
+    # Under ASGI every request runs its queries in a thread of its own, so
+    # persistent connections would pile up, one per request: close them at
+    # the end of the request instead (DB_POOL caps and reuses them)
+    if ASGI_SERVER:
+        for database in DATABASES.values():
+            database["CONN_MAX_AGE"] = 0
+
+# Seconds a change may take to reach the replica: reads of a changed model,
+# and of a client that just wrote, stay on the primary for that long
+DB_REPLICA_LAG = config("DB_REPLICA_LAG", cast=float, default=5)
+
+
+# SQLite PRAGMAs, set on every new connection (see `manage.py check_sqlite`)
+# https://www.sqlite.org/pragma.html
+# WAL lets readers and one writer work concurrently; synchronous=normal is
+# safe with WAL and only syncs on checkpoints. Empty values are left unset.
+SQLITE_PRAGMAS = {
+    "journal_mode": config("SQLITE_JOURNAL_MODE", default="wal"),
+    "synchronous": config("SQLITE_SYNCHRONOUS", default="normal"),
+    "busy_timeout": config("SQLITE_BUSY_TIMEOUT", default="5000"),
+    "cache_size": config("SQLITE_CACHE_SIZE", default="-20000"),
+    "mmap_size": config("SQLITE_MMAP_SIZE", default="134217728"),
+    "temp_store": config("SQLITE_TEMP_STORE", default="memory"),
+}
+
+
+# Caches
+# https://docs.djangoproject.com/en/stable/topics/cache/
+# https://docs.djangoproject.com/en/stable/ref/settings/#caches
+
+# Every alias uses CACHE_BACKEND unless overridden, e.g. CACHE_TEMPLATES_BACKEND
+# Run `manage.py createcachetable` once when using the "db" backend
+# Cache versions and generations must be seen by every worker, so "locmem"
+# (one cache per process) only suits a single process (see core.E003)
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    # Django's, with an atomic add() for the refresh locks (see file_cache.py)
+    "file": "apps.core.management.file_cache.FileBasedCache",
+    "db": "django.core.cache.backends.db.DatabaseCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+
+CACHE_BACKEND = config("CACHE_BACKEND", default="file")
+CACHE_LOCATION = config("CACHE_LOCATION", default="")
+CACHE_KEY_PREFIX = config("CACHE_KEY_PREFIX", default="dms")
+# Change on deploy (e.g. to the release or commit) to start from a cold cache
+CACHE_VERSION = config("CACHE_VERSION", default="1")
+# Count hits and misses per alias (see `manage.py cache_stats`)
+CACHE_STATS = config("CACHE_STATS", cast=bool, default=True)
+
+
+def cache_alias(alias, timeout, versioned=True):
+    backend = config(f"CACHE_{alias.upper()}_BACKEND", default=CACHE_BACKEND)
+    location = config(f"CACHE_{alias.upper()}_LOCATION", default="")
+    if not location:
+        location = {
+            "locmem": alias,
+            "file": str(Path(CACHE_LOCATION or LIB_DIR / "cache") / alias),
+            "db": f"{CACHE_LOCATION or 'cache'}_{alias}",
+            "redis": CACHE_LOCATION or "redis://127.0.0.1:6379/0",
+        }[backend]
+
+    backend_path = CACHE_BACKENDS[backend]
+    if CACHE_STATS:
+        name = backend_path.rsplit(".", 1)[1]
+        backend_path = f"apps.core.management.cache_backends.{name}"
+
+    # Aliases can share one Redis database or cache directory: keep them apart
+    key_prefix = f"{CACHE_KEY_PREFIX}:{alias}"
+    if versioned:
+        key_prefix += f":{CACHE_VERSION}"
+
+    return {
+        "BACKEND": backend_path,
+        "LOCATION": location,
+        "TIMEOUT": timeout,
+        "KEY_PREFIX": key_prefix,
+    }
+
+
+CACHES = {
+    "default": cache_alias("default", 300),
+    # Sessions outlive deploys, so they aren't versioned
+    "sessions": cache_alias("sessions", None, versioned=False),
+    "templates": cache_alias("templates", 600),
+    "api": cache_alias("api", 60),
+}
+
+# Sessions are read from the cache and written through to the database, as
+# long as the cache is shared: a logout must reach every worker
+SESSION_CACHE_ALIAS = "sessions"
+if config("CACHE_SESSIONS_BACKEND", default=CACHE_BACKEND) == "locmem":
+    SESSION_ENGINE = "django.contrib.sessions.backends.db"
+else:
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+
 
 # Email
 # https://docs.djangoproject.com/en/stable/topics/email/
@@ -148,6 +290,9 @@ AUTH_PASSWORD_VALIDATORS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "apps.core.middleware.static.StaticFilesMiddleware",
+    "apps.core.middleware.queries.QueryBudgetMiddleware",
+    "apps.core.middleware.replica.ReplicaMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -159,17 +304,46 @@ MIDDLEWARE = [
 if DEBUG:
     MIDDLEWARE.append("django_browser_reload.middleware.BrowserReloadMiddleware")
 
+# Query budgets (see QueryBudgetMiddleware and @query_budget)
+# Share of requests whose queries are recorded; 0 disables the middleware
+QUERY_BUDGET_SAMPLE_RATE = config(
+    "QUERY_BUDGET_SAMPLE_RATE", cast=float, default=1.0 if DEBUG else 0.0
+)
+# Defaults for views without @query_budget; 0 disables the check
+QUERY_BUDGET_QUERIES = config("QUERY_BUDGET_QUERIES", cast=int, default=50)
+QUERY_BUDGET_MS = config("QUERY_BUDGET_MS", cast=float, default=200)
+# Times the same query shape may run before it's reported as an N+1 query
+QUERY_BUDGET_REPEATS = config("QUERY_BUDGET_REPEATS", cast=int, default=5)
+QUERY_BUDGET_SERVER_TIMING = config(
+    "QUERY_BUDGET_SERVER_TIMING", cast=bool, default=DEBUG
+)
+
 
 # Templates
 # https://docs.djangoproject.com/en/stable/topics/templates/
 # https://docs.djangoproject.com/en/stable/ref/settings/#templates
 
+# The same loaders Django uses by default, listed so the cache can be turned
+# off. Django resets the cached loader when the dev server sees a template
+# change, so it stays on in DEBUG; without it every render parses its
+# templates again (see `manage.py check_templates`).
+TEMPLATE_CACHE = config("TEMPLATE_CACHE", cast=bool, default=True)
+
+TEMPLATE_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [],
-        "APP_DIRS": True,
         "OPTIONS": {
+            "loaders": (
+                [("django.template.loaders.cached.Loader", TEMPLATE_LOADERS)]
+                if TEMPLATE_CACHE
+                else TEMPLATE_LOADERS
+            ),
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -192,12 +366,46 @@ STATICFILES_FINDERS = [
 ]
 
 SASS_PRECISION = 8
+SASS_CACHE_DIR = LIB_DIR / "scss-cache"
 
 STATIC_URL = "lib/static/"
 MEDIA_URL = "lib/media/"
 STATIC_ROOT = LIB_DIR / "static"
 MEDIA_ROOT = LIB_DIR / "media"
 
+# Serve STATIC_ROOT/MEDIA_ROOT from the app (see StaticFilesMiddleware)
+# Hashed files are cached for a year, everything else for STATIC_MAX_AGE
+SERVE_STATIC = config("SERVE_STATIC", cast=bool, default=not DEBUG)
+STATIC_MAX_AGE = config("STATIC_MAX_AGE", cast=int, default=60)
+
+# Static bundles (built by `buildbundles`), served file by file when disabled
+BUNDLES_ROOT = LIB_DIR / "bundles"
+STATICFILES_DIRS = [BUNDLES_ROOT]
+# BUNDLES_ROOT is created by `buildbundles`; until then there's nothing in it
+SILENCED_SYSTEM_CHECKS = ["staticfiles.W004"]
+STATIC_BUNDLES = config("STATIC_BUNDLES", cast=bool, default=not DEBUG)
+
+# Content-hashed file names + staticfiles.json manifest (built by `buildstatic`)
+# Use "apps.core.management.storage.HashedStaticFilesStorage" to collect serially
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "apps.core.management.storage.ParallelManifestStaticFilesStorage",
+        "OPTIONS": {
+            "max_workers": config("STATIC_WORKERS", cast=int, default=8),
+        },
+    },
+}
+
+
+# Pre-rendered pages
+# Written by `manage.py prerender`; regenerated on content saves when enabled
+
+PUBLISH_ROOT = config("PUBLISH_ROOT", default=str(LIB_DIR / "publish"))
+PUBLISH_ON_SAVE = config("PUBLISH_ON_SAVE", cast=bool, default=False)
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/stable/topics/i18n/